@@ -4,9 +4,10 @@ Universal Batch Processor - Sistema unificado de procesamiento por lotes
 Procesamiento batch para todos los módulos: converter, splitter, spectrogram
 """
 
+import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -30,6 +31,42 @@ except ImportError:
 
 console = Console()
 
+DEFAULT_AUDIO_EXTENSIONS = ('.wav', '.mp3', '.flac', '.m4a', '.ogg')
+
+
+def _scan_audio_files(root: str, suffixes: Tuple[str, ...], recursive: bool,
+                      _ancestors: Optional[set] = None) -> Iterator[str]:
+    """
+    Recorrer root con os.scandir y devolver rutas de archivos cuyo nombre
+    termina en alguna de las extensiones (en minúsculas)
+
+    Un solo listado por directorio (sin un glob por extensión) y sin stat
+    extra: DirEntry cachea el tipo de entrada. El nombre se compara en
+    minúsculas, así que SONG.WAV también se encuentra. Como el glob, se
+    siguen los enlaces simbólicos a directorios; un enlace que apunta a un
+    directorio que se está recorriendo (ciclo) se ignora.
+    """
+    if _ancestors is None:
+        _ancestors = set()
+    if recursive:
+        root_stat = os.stat(root)
+        key = (root_stat.st_dev, root_stat.st_ino)
+        if key in _ancestors:
+            return
+        _ancestors.add(key)
+
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        yield from _scan_audio_files(entry.path, suffixes, recursive, _ancestors)
+                elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                    yield entry.path
+    finally:
+        if recursive:
+            _ancestors.discard(key)
+
 
 class BatchOperation(Enum):
     """Tipos de operaciones batch disponibles"""
@@ -84,7 +121,7 @@ class UniversalBatchProcessor:
             Lista de Path de archivos encontrados
         """
         if extensions is None:
-            extensions = ['.wav', '.mp3', '.flac', '.m4a', '.ogg']
+            extensions = DEFAULT_AUDIO_EXTENSIONS
 
         path = Path(input_path)
 
@@ -98,13 +135,9 @@ class UniversalBatchProcessor:
 
         # Si es directorio, buscar archivos
         if path.is_dir():
-            files = []
-            pattern = "**/*" if recursive else "*"
-
-            for ext in extensions:
-                files.extend(path.glob(f"{pattern}{ext}"))
-
-            return sorted(files)
+            suffixes = tuple(ext.lower() for ext in extensions)
+            files = _scan_audio_files(str(path), suffixes, recursive)
+            return sorted(map(Path, files))
 
         return []
 
@@ -109,7 +109,7 @@ class SpectrogramGenerator:
             file_path = self._validate_input_file(input_file)
             
             # Load audio with scientific accuracy
-            self._progress_tracker.update(10, "Loading audio file")
+            self._progress_tracker.update_fast(10, 100, "Loading audio file")
             y, sr = self._load_audio(file_path)
             
             # Get Mel parameters
@@ -118,7 +118,7 @@ class SpectrogramGenerator:
                 mel_params.update(params)
             
             # Generate Mel spectrogram
-            self._progress_tracker.update(30, "Computing Mel spectrogram")
+            self._progress_tracker.update_fast(30, 100, "Computing Mel spectrogram")
             mel_spec = librosa.feature.melspectrogram(
                 y=y, sr=sr,
                 n_mels=mel_params['n_mels'],
@@ -134,7 +134,7 @@ class SpectrogramGenerator:
             mel_spec_db = librosa.power_to_db(mel_spec, ref=np.max)
             
             # Create LLM-optimized visualization
-            self._progress_tracker.update(60, "Creating visualization")
+            self._progress_tracker.update_fast(60, 100, "Creating visualization")
             image_data, image_path = self._create_spectrogram_image(
                 mel_spec_db, sr, mel_params['hop_length'],
                 'Mel Frequency (Hz)', mel_params['fmin'], mel_params['fmax'],
@@ -142,7 +142,7 @@ class SpectrogramGenerator:
             )
             
             # Calculate quality metrics
-            self._progress_tracker.update(80, "Calculating metrics")
+            self._progress_tracker.update_fast(80, 100, "Calculating metrics")
             metrics = self._calculate_quality_metrics(
                 mel_spec_db, sr, mel_params, y
             )
@@ -192,7 +192,7 @@ class SpectrogramGenerator:
             file_path = self._validate_input_file(input_file)
             
             # Load audio
-            self._progress_tracker.update(10, "Loading audio file")
+            self._progress_tracker.update_fast(10, 100, "Loading audio file")
             y, sr = self._load_audio(file_path)
             
             # Get linear parameters
@@ -201,7 +201,7 @@ class SpectrogramGenerator:
                 linear_params.update(params)
             
             # Generate STFT
-            self._progress_tracker.update(30, "Computing STFT")
+            self._progress_tracker.update_fast(30, 100, "Computing STFT")
             f, t, Zxx = stft(
                 y, fs=sr,
                 window=linear_params['window'],
@@ -215,7 +215,7 @@ class SpectrogramGenerator:
             magnitude_db = 20 * np.log10(magnitude + 1e-10)  # Avoid log(0)
             
             # Create visualization
-            self._progress_tracker.update(60, "Creating visualization")
+            self._progress_tracker.update_fast(60, 100, "Creating visualization")
             image_data, image_path = self._create_spectrogram_image(
                 magnitude_db, sr, linear_params['n_fft']//4,
                 'Frequency (Hz)', 0, sr//2,
@@ -223,7 +223,7 @@ class SpectrogramGenerator:
             )
             
             # Calculate metrics
-            self._progress_tracker.update(80, "Calculating metrics")
+            self._progress_tracker.update_fast(80, 100, "Calculating metrics")
             metrics = self._calculate_quality_metrics(
                 magnitude_db, sr, linear_params, y
             )
@@ -273,7 +273,7 @@ class SpectrogramGenerator:
             file_path = self._validate_input_file(input_file)
             
             # Load audio
-            self._progress_tracker.update(10, "Loading audio file")
+            self._progress_tracker.update_fast(10, 100, "Loading audio file")
             y, sr = self._load_audio(file_path)
 
             # CQT parameters for musical analysis
@@ -285,7 +285,7 @@ class SpectrogramGenerator:
             hop_length = params.get('hop_length', 512)
             
             # Generate CQT
-            self._progress_tracker.update(30, "Computing CQT")
+            self._progress_tracker.update_fast(30, 100, "Computing CQT")
             cqt = np.abs(librosa.cqt(
                 y, sr=sr,
                 fmin=fmin,
@@ -298,7 +298,7 @@ class SpectrogramGenerator:
             cqt_db = librosa.amplitude_to_db(cqt, ref=np.max)
             
             # Create visualization with musical context
-            self._progress_tracker.update(60, "Creating musical visualization")
+            self._progress_tracker.update_fast(60, 100, "Creating musical visualization")
             image_data, image_path = self._create_spectrogram_image(
                 cqt_db, sr, hop_length,
                 'Musical Note', fmin, fmin * (2 ** (n_bins / bins_per_octave)),
@@ -306,7 +306,7 @@ class SpectrogramGenerator:
             )
             
             # Calculate metrics
-            self._progress_tracker.update(80, "Calculating metrics")
+            self._progress_tracker.update_fast(80, 100, "Calculating metrics")
             cqt_params = {'hop_length': hop_length, 'n_fft': 2048}
             metrics = self._calculate_quality_metrics(cqt_db, sr, cqt_params, y)
             metrics['musical_analysis'] = {
@@ -370,7 +370,7 @@ class SpectrogramGenerator:
         for i, input_file in enumerate(input_files):
             try:
                 file_progress = int((i / len(input_files)) * 100)
-                self._progress_tracker.update(file_progress, f"Processing {i+1}/{len(input_files)}")
+                self._progress_tracker.update_fast(file_progress, 100, f"Processing {i+1}/{len(input_files)}")
                 
                 file_path = Path(input_file)
                 file_results = []
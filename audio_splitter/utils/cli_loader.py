@@ -13,9 +13,49 @@ import yaml
 import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
-from rich.console import Console
 
-console = Console()
+# Rich is only needed for warnings and example/workflow display, so the
+# console is created on first use instead of at import time
+_console_obj = None
+
+def _console():
+    """Return the shared Rich console, importing Rich on first use"""
+    global _console_obj
+    if _console_obj is None:
+        from rich.console import Console
+        _console_obj = Console()
+    return _console_obj
+
+# Top-level sections every CLI data file must define
+_REQUIRED_SECTIONS = frozenset(('metadata', 'global_info', 'commands'))
+
+# Default CLI data location, relative to the package root
+_DEFAULT_DATA_FILE = Path(__file__).resolve().parent.parent.parent / "docs" / "cli_data.yaml"
+
+# Type tags that appear on almost every argument/option; interning them makes
+# the parser's `opt_type == 'flag'` style comparisons pointer checks.
+_TYPE_TAGS = frozenset(('string', 'string[]', 'integer', 'float', 'flag', 'choice'))
+
+# argparse keyword arguments implied by each YAML option type
+_OPT_TYPE_KWARGS = {
+    'flag': {'action': 'store_true'},
+    'integer': {'type': int},
+    'float': {'type': float},
+    'string[]': {'nargs': '+'},
+}
+
+def _intern_keys(obj: Any) -> Any:
+    """Recursively intern dict keys and type tags of parsed YAML data"""
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(k) if isinstance(k, str) else k): _intern_keys(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_keys(item) for item in obj]
+    if isinstance(obj, str) and obj in _TYPE_TAGS:
+        return sys.intern(obj)
+    return obj
 
 class EnhancedCLILoader:
     """
@@ -25,12 +65,7 @@ class EnhancedCLILoader:
     
     def __init__(self, data_file: Optional[str] = None):
         """Initialize with CLI data YAML file"""
-        if data_file is None:
-            # Default path relative to package root
-            package_root = Path(__file__).parent.parent.parent
-            data_file = package_root / "docs" / "cli_data.yaml"
-        
-        self.data_file = Path(data_file)
+        self.data_file = _DEFAULT_DATA_FILE if data_file is None else Path(data_file)
         self.cli_data = self._load_cli_data()
         
         # Extract main sections
@@ -40,12 +75,118 @@ class EnhancedCLILoader:
         self.global_options = self.cli_data.get('global_options', {})
         self.workflows = self.cli_data.get('workflows', {})
         self.help_info = self.cli_data.get('help_info', {})
+        
+        # Pre-index parser inputs once so parser construction avoids re-walking YAML
+        self._build_command_index()
+    
+    def _build_command_index(self):
+        """Pre-extract epilogs, arguments, options and subcommands for every command"""
+        self._cmd_args = {}
+        self._cmd_opts = {}
+        self._cmd_subs = {}
+        self._cmd_epilogs = {}
+        self._requires_graph = {}
+        
+        for cmd_name, cmd_data in self.commands.items():
+            self._cmd_epilogs[cmd_name] = self._generate_command_epilog(cmd_name, cmd_data)
+            
+            # Option dependencies as (option_attr, option_flag, required_attr, required_flag)
+            requires = [
+                (opt_name, opt_data.get('flags', [f'--{opt_name}'])[0],
+                 required_opt.replace('--', ''), required_opt)
+                for opt_name, opt_data in (cmd_data.get('options') or {}).items()
+                for required_opt in opt_data.get('requires', ())
+            ]
+            if requires:
+                self._requires_graph[cmd_name] = requires
+            
+            self._cmd_args[cmd_name] = [
+                self._argument_spec(arg_name, arg_data)
+                for arg_name, arg_data in (cmd_data.get('arguments') or {}).items()
+            ]
+            self._cmd_opts[cmd_name] = [
+                self._option_spec(opt_name, opt_data)
+                for opt_name, opt_data in (cmd_data.get('options') or {}).items()
+            ]
+            self._cmd_subs[cmd_name] = [
+                (
+                    sub_name,
+                    sub_data.get('description', ''),
+                    [
+                        self._argument_spec(arg_name, arg_data)
+                        for arg_name, arg_data in (sub_data.get('arguments') or {}).items()
+                    ],
+                    [
+                        self._option_spec(opt_name, opt_data)
+                        for opt_name, opt_data in (sub_data.get('options') or {}).items()
+                    ]
+                )
+                for sub_name, sub_data in (cmd_data.get('subcommands') or {}).items()
+            ]
+    
+    @staticmethod
+    def _argument_spec(arg_name: str, arg_data: Dict[str, Any]) -> tuple:
+        """Compile a positional argument definition into (name, add_argument kwargs)"""
+        kwargs = {
+            'help': arg_data.get('description', '')
+        }
+        
+        # Handle argument type
+        arg_type = arg_data.get('type', 'string')
+        if arg_type == 'integer':
+            kwargs['type'] = int
+        elif arg_type == 'float':
+            kwargs['type'] = float
+        elif arg_type == 'choice':
+            kwargs['choices'] = arg_data.get('choices', [])
+        
+        # Add metavar for better help display
+        formats = arg_data.get('formats_supported')
+        if formats is not None:
+            kwargs['metavar'] = f"FILE ({','.join(formats)})"
+        
+        return arg_name, kwargs
+    
+    @staticmethod
+    def _option_spec(opt_name: str, opt_data: Dict[str, Any]) -> tuple:
+        """
+        Compile an option definition into (flags, add_argument kwargs)
+        so parser construction is a single add_argument call
+        """
+        help_text = opt_data.get('description', '')
+        
+        # Add help for choices
+        choices_info = opt_data.get('choices_help')
+        if isinstance(choices_info, dict):
+            help_text += " Choices: " + ", ".join([f"{k}={v}" for k, v in choices_info.items()])
+        
+        kwargs = {
+            'help': help_text,
+            'dest': opt_name
+        }
+        
+        # Handle option type
+        opt_type = opt_data.get('type', 'string')
+        if opt_type == 'choice':
+            kwargs['choices'] = opt_data.get('choices', [])
+        else:
+            kwargs.update(_OPT_TYPE_KWARGS.get(opt_type, {}))
+        
+        # Handle default values
+        if opt_data.get('default') is not None:
+            kwargs['default'] = opt_data['default']
+        
+        # Handle required options
+        if opt_data.get('required', False):
+            kwargs['required'] = True
+        
+        return tuple(opt_data.get('flags', [f'--{opt_name}'])), kwargs
     
     def _load_cli_data(self) -> Dict[str, Any]:
         """Load and validate CLI data from YAML"""
         if not self.data_file.exists():
-            console.print(f"[yellow]Warning: CLI data file not found: {self.data_file}[/yellow]")
-            console.print("[yellow]Using fallback parser configuration[/yellow]")
+            _console().print(f"[yellow]Warning: CLI data file not found: {self.data_file}[/yellow]")
+            _console().print("[yellow]Using fallback parser configuration[/yellow]")
             return self._get_fallback_data()
         
         try:
@@ -53,19 +194,19 @@ class EnhancedCLILoader:
                 data = yaml.safe_load(f)
             
             # Validate required sections
-            required_sections = ['metadata', 'global_info', 'commands']
-            for section in required_sections:
-                if section not in data:
-                    console.print(f"[red]Error: Missing required section '{section}' in CLI data[/red]")
-                    return self._get_fallback_data()
+            missing = _REQUIRED_SECTIONS - data.keys()
+            if missing:
+                _console().print(f"[red]Error: Missing required section(s) {', '.join(sorted(missing))} in CLI data[/red]")
+                return self._get_fallback_data()
             
-            return data
+            # Many keys repeat across commands/options/examples; share them
+            return _intern_keys(data)
             
         except yaml.YAMLError as e:
-            console.print(f"[red]Error parsing CLI data YAML: {e}[/red]")
+            _console().print(f"[red]Error parsing CLI data YAML: {e}[/red]")
             return self._get_fallback_data()
         except Exception as e:
-            console.print(f"[red]Error loading CLI data: {e}[/red]")
+            _console().print(f"[red]Error loading CLI data: {e}[/red]")
             return self._get_fallback_data()
     
     def _get_fallback_data(self) -> Dict[str, Any]:
@@ -127,109 +268,55 @@ class EnhancedCLILoader:
             help=cmd_data.get('description', ''),
             description=cmd_data.get('description', ''),
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=self._generate_command_epilog(cmd_name, cmd_data)
+            epilog=self._cmd_epilogs[cmd_name]
         )
         
         # Add arguments
-        if 'arguments' in cmd_data:
-            for arg_name, arg_data in cmd_data['arguments'].items():
-                self._add_argument(cmd_parser, arg_name, arg_data)
+        for arg_spec in self._cmd_args[cmd_name]:
+            self._add_argument(cmd_parser, arg_spec)
         
         # Add options
-        if 'options' in cmd_data:
-            for opt_name, opt_data in cmd_data['options'].items():
-                self._add_option(cmd_parser, opt_name, opt_data)
+        for opt_spec in self._cmd_opts[cmd_name]:
+            self._add_option(cmd_parser, opt_spec)
         
         # Handle subcommands (like quality-settings)
-        if 'subcommands' in cmd_data:
+        if self._cmd_subs[cmd_name]:
             sub_subparsers = cmd_parser.add_subparsers(
                 dest=f'{cmd_name}_action',
                 help=f'{cmd_name} actions',
                 metavar='ACTION'
             )
             
-            for sub_name, sub_data in cmd_data['subcommands'].items():
-                self._add_subcommand_parser(sub_subparsers, sub_name, sub_data)
+            for sub_spec in self._cmd_subs[cmd_name]:
+                self._add_subcommand_parser(sub_subparsers, sub_spec)
     
-    def _add_argument(self, parser: argparse.ArgumentParser, arg_name: str, arg_data: Dict[str, Any]):
-        """Add positional argument to parser"""
-        kwargs = {
-            'help': arg_data.get('description', '')
-        }
-        
-        # Handle argument type
-        arg_type = arg_data.get('type', 'string')
-        if arg_type == 'integer':
-            kwargs['type'] = int
-        elif arg_type == 'float':
-            kwargs['type'] = float
-        elif arg_type == 'choice':
-            kwargs['choices'] = arg_data.get('choices', [])
-        
-        # Add metavar for better help display
-        if 'formats_supported' in arg_data:
-            kwargs['metavar'] = f"FILE ({','.join(arg_data['formats_supported'])})"
-        
+    def _add_argument(self, parser: argparse.ArgumentParser, arg_spec: tuple):
+        """Add positional argument to parser from a precompiled argument spec"""
+        arg_name, kwargs = arg_spec
         parser.add_argument(arg_name, **kwargs)
     
-    def _add_option(self, parser: argparse.ArgumentParser, opt_name: str, opt_data: Dict[str, Any]):
-        """Add optional argument to parser"""
-        flags = opt_data.get('flags', [f'--{opt_name}'])
-        
-        kwargs = {
-            'help': opt_data.get('description', ''),
-            'dest': opt_name
-        }
-        
-        # Handle option type
-        opt_type = opt_data.get('type', 'string')
-        
-        if opt_type == 'flag':
-            kwargs['action'] = 'store_true'
-        elif opt_type == 'integer':
-            kwargs['type'] = int
-        elif opt_type == 'float':
-            kwargs['type'] = float
-        elif opt_type == 'choice':
-            kwargs['choices'] = opt_data.get('choices', [])
-        elif opt_type == 'string[]':
-            kwargs['nargs'] = '+'
-        
-        # Handle default values
-        if 'default' in opt_data and opt_data['default'] is not None:
-            kwargs['default'] = opt_data['default']
-        
-        # Handle required options
-        if opt_data.get('required', False):
-            kwargs['required'] = True
-        
-        # Add help for choices
-        if 'choices_help' in opt_data:
-            choices_info = opt_data['choices_help']
-            if isinstance(choices_info, dict):
-                help_text = kwargs['help']
-                help_text += " Choices: " + ", ".join([f"{k}={v}" for k, v in choices_info.items()])
-                kwargs['help'] = help_text
-        
+    def _add_option(self, parser: argparse.ArgumentParser, opt_spec: tuple):
+        """Add optional argument to parser from a precompiled option spec"""
+        flags, kwargs = opt_spec
         parser.add_argument(*flags, **kwargs)
     
-    def _add_subcommand_parser(self, subparsers, sub_name: str, sub_data: Dict[str, Any]):
+    def _add_subcommand_parser(self, subparsers, sub_spec: tuple):
         """Add subcommand parser (for commands like quality-settings)"""
+        sub_name, description, arguments, options = sub_spec
+        
         sub_parser = subparsers.add_parser(
             sub_name,
-            help=sub_data.get('description', ''),
-            description=sub_data.get('description', '')
+            help=description,
+            description=description
         )
         
         # Add arguments for subcommand
-        if 'arguments' in sub_data:
-            for arg_name, arg_data in sub_data['arguments'].items():
-                self._add_argument(sub_parser, arg_name, arg_data)
+        for arg_spec in arguments:
+            self._add_argument(sub_parser, arg_spec)
         
         # Add options for subcommand
-        if 'options' in sub_data:
-            for opt_name, opt_data in sub_data['options'].items():
-                self._add_option(sub_parser, opt_name, opt_data)
+        for opt_spec in options:
+            self._add_option(sub_parser, opt_spec)
     
     def _generate_epilog(self) -> str:
         """Generate epilog text for main parser"""
@@ -318,58 +405,45 @@ class EnhancedCLILoader:
         examples = self.get_command_examples(command)
         
         if not examples:
-            console.print(f"[yellow]No examples available for command '{command}'[/yellow]")
+            _console().print(f"[yellow]No examples available for command '{command}'[/yellow]")
             return
         
-        console.print(f"\n[bold cyan]Examples for '{command}' command:[/bold cyan]")
+        _console().print(f"\n[bold cyan]Examples for '{command}' command:[/bold cyan]")
         
         for example in examples:
-            console.print(f"\n[yellow]{example['title']}:[/yellow]")
+            _console().print(f"\n[yellow]{example['title']}:[/yellow]")
             if example['description']:
-                console.print(f"[dim]{example['description']}[/dim]")
-            console.print(f"[green]{example['command']}[/green]")
+                _console().print(f"[dim]{example['description']}[/dim]")
+            _console().print(f"[green]{example['command']}[/green]")
     
     def show_command_workflows(self, command: str):
         """Display workflows for a command using Rich console"""
         workflows = self.get_command_workflows(command)
         
         if not workflows:
-            console.print(f"[yellow]No workflows available for command '{command}'[/yellow]")
+            _console().print(f"[yellow]No workflows available for command '{command}'[/yellow]")
             return
         
-        console.print(f"\n[bold cyan]Workflows for '{command}' command:[/bold cyan]")
+        _console().print(f"\n[bold cyan]Workflows for '{command}' command:[/bold cyan]")
         
         for workflow in workflows:
-            console.print(f"\n[bold yellow]{workflow['title']}[/bold yellow]")
-            console.print(f"[dim]{workflow['description']}[/dim]")
+            _console().print(f"\n[bold yellow]{workflow['title']}[/bold yellow]")
+            _console().print(f"[dim]{workflow['description']}[/dim]")
             
             for step in workflow['steps']:
-                console.print(f"\n[white]Step {step['step']}:[/white] {step['action']}")
-                console.print(f"[green]  {step['command']}[/green]")
+                _console().print(f"\n[white]Step {step['step']}:[/white] {step['action']}")
+                _console().print(f"[green]  {step['command']}[/green]")
     
     def validate_arguments(self, args: argparse.Namespace) -> bool:
         """Validate parsed arguments against YAML constraints"""
         if not hasattr(args, 'command') or not args.command:
             return True  # No command to validate
         
-        command = args.command
-        if command not in self.commands:
-            return True  # Unknown command, let argparse handle it
-        
-        cmd_data = self.commands[command]
-        
         # Validate option dependencies
-        if 'options' in cmd_data:
-            for opt_name, opt_data in cmd_data['options'].items():
-                if 'requires' in opt_data and hasattr(args, opt_name):
-                    option_value = getattr(args, opt_name)
-                    if option_value:  # Option is set
-                        # Check if required options are also set
-                        for required_opt in opt_data['requires']:
-                            required_opt_name = required_opt.replace('--', '')
-                            if not hasattr(args, required_opt_name) or not getattr(args, required_opt_name):
-                                console.print(f"[red]Error: {opt_data['flags'][0]} requires {required_opt}[/red]")
-                                return False
+        for opt_attr, opt_flag, required_attr, required_opt in self._requires_graph.get(args.command, ()):
+            if getattr(args, opt_attr, None) and not getattr(args, required_attr, None):
+                _console().print(f"[red]Error: {opt_flag} requires {required_opt}[/red]")
+                return False
         
         return True
 
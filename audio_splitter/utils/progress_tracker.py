@@ -3,11 +3,15 @@ Progress Tracker - Utility for tracking progress across different interfaces
 Compatible with CLI, Interactive, and Worker progress callbacks
 """
 
+import sys
 import time
-from typing import Optional, Callable, Dict, Any, Union
-from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Any, Union, NamedTuple
 from enum import Enum
 
+# Minimum time between console progress lines (50 ms, in nanoseconds);
+# stage changes and completion always print
+_PRINT_INTERVAL_NS = 50 * 1_000_000
+
 class ProgressStage(Enum):
     """Progress stages for audio processing operations"""
     LOADING = "loading"
@@ -18,28 +22,25 @@ class ProgressStage(Enum):
     COMPLETE = "complete"
     ERROR = "error"
 
-@dataclass
-class ProgressInfo:
+# Precomputed stage strings so hot paths avoid Enum descriptor lookups
+_STAGE_VALUE = {stage: stage.value for stage in ProgressStage}
+_STAGE_TITLE = {stage: stage.value.title() for stage in ProgressStage}
+
+class ProgressInfo(NamedTuple):
     """Progress information structure"""
     current: int
     total: int
     percentage: float
     stage: ProgressStage
     message: str
-    timestamp: float
+    timestamp: float  # Wall-clock time.time() at update
     operation: str = "unknown"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            'current': self.current,
-            'total': self.total,
-            'percentage': self.percentage,
-            'stage': self.stage.value,
-            'message': self.message,
-            'timestamp': self.timestamp,
-            'operation': self.operation
-        }
+        data = self._asdict()
+        data['stage'] = _STAGE_VALUE[self.stage]
+        return data
 
 class ProgressTracker:
     """
@@ -47,11 +48,18 @@ class ProgressTracker:
     Compatible with CLI, Interactive UI, and Worker callbacks
     """
     
+    __slots__ = ('operation', 'callback', 'start_time',
+                 '_start_ns', '_last_print_ns', 'current_stage', 'stages_completed')
+    
     def __init__(self, operation: str = "audio_processing", 
                  callback: Optional[Callable[[int, int, str], None]] = None):
         self.operation = operation
         self.callback = callback
         self.start_time = time.time()
+        # Elapsed time is measured on the monotonic clock; start_time stays
+        # wall-clock for callers
+        self._start_ns = time.monotonic_ns()
+        self._last_print_ns = None
         self.current_stage = ProgressStage.LOADING
         self.stages_completed = []
         
@@ -61,19 +69,22 @@ class ProgressTracker:
         # Handle both APIs: update(current, total, message) and update(current, message)
         if isinstance(total_or_message, str):
             # Old API: update(current, message)
-            total = 100
-            message = total_or_message
-        else:
-            # New API: update(current, total, message)
-            total = total_or_message
-        
+            return self.update_fast(current, 100, total_or_message, stage)
+        # New API: update(current, total, message)
+        return self.update_fast(current, total_or_message, message, stage)
+    
+    def update_fast(self, current: int, total: int = 100, message: str = "",
+                    stage: Optional[ProgressStage] = None):
+        """Update progress with an explicit total - no API disambiguation"""
+        stage_changed = False
         if stage and stage != self.current_stage:
             self.current_stage = stage
+            stage_changed = True
             if stage not in self.stages_completed:
                 self.stages_completed.append(stage)
         
         percentage = (current / total * 100) if total > 0 else 0
-        timestamp = time.time()
+        now_ns = time.monotonic_ns()
         
         # Create progress info
         progress_info = ProgressInfo(
@@ -82,17 +93,20 @@ class ProgressTracker:
             percentage=percentage,
             stage=self.current_stage,
             message=message,
-            timestamp=timestamp,
+            timestamp=time.time(),
             operation=self.operation
         )
         
         # Call the callback if provided (for Worker integration)
-        if self.callback:
+        if self.callback is not None:
             self.callback(current, total, message)
         
-        # Log progress
-        elapsed = timestamp - self.start_time
-        print(f"[{elapsed:.1f}s] {self.operation}: {percentage:.1f}% - {message}")
+        # Log progress (throttled so tight loops don't flood stdout)
+        if (stage_changed or current >= total or self._last_print_ns is None
+                or now_ns - self._last_print_ns >= _PRINT_INTERVAL_NS):
+            self._last_print_ns = now_ns
+            elapsed = (now_ns - self._start_ns) * 1e-9
+            print(f"[{elapsed:.1f}s] {self.operation}: {percentage:.1f}% - {message}")
         
         return progress_info
     
@@ -100,21 +114,24 @@ class ProgressTracker:
         """Set current processing stage"""
         self.current_stage = stage
         if message:
-            print(f"[{self.operation}] {stage.value.title()}: {message}")
+            print(f"[{self.operation}] {_STAGE_TITLE[stage]}: {message}")
     
     def complete(self, message: str = "Operation completed"):
         """Mark operation as complete"""
-        elapsed = time.time() - self.start_time
+        elapsed = (time.monotonic_ns() - self._start_ns) * 1e-9
         self.set_stage(ProgressStage.COMPLETE, f"{message} ({elapsed:.1f}s)")
+        sys.stdout.flush()
         
     def error(self, error_message: str):
         """Mark operation as failed"""
-        elapsed = time.time() - self.start_time
+        elapsed = (time.monotonic_ns() - self._start_ns) * 1e-9
         self.set_stage(ProgressStage.ERROR, f"Error: {error_message} ({elapsed:.1f}s)")
+        sys.stdout.flush()
     
     def start(self, message: str = "Starting operation"):
         """Start the operation tracking"""
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self.set_stage(ProgressStage.LOADING, message)
         print(f"[{self.operation}] {message}")
     
@@ -125,6 +142,8 @@ class ProgressTracker:
 class SpectrogramProgressTracker(ProgressTracker):
     """Specialized progress tracker for spectrogram generation"""
     
+    __slots__ = ('spectrogram_type',)
+    
     def __init__(self, spectrogram_type: str = "mel", 
                  callback: Optional[Callable[[int, int, str], None]] = None):
         super().__init__(f"spectrogram_{spectrogram_type}", callback)
@@ -133,32 +152,32 @@ class SpectrogramProgressTracker(ProgressTracker):
     def start_loading(self, filename: str):
         """Start audio loading phase"""
         self.set_stage(ProgressStage.LOADING, f"Loading audio file: {filename}")
-        return self.update(10, 100, f"Loading {filename}")
+        return self.update_fast(10, 100, f"Loading {filename}")
     
     def start_analyzing(self):
         """Start audio analysis phase"""
         self.set_stage(ProgressStage.ANALYZING, "Analyzing audio properties")
-        return self.update(25, 100, "Analyzing frequency content and dynamics")
+        return self.update_fast(25, 100, "Analyzing frequency content and dynamics")
     
     def start_generating(self):
         """Start spectrogram generation phase"""
         self.set_stage(ProgressStage.GENERATING, f"Generating {self.spectrogram_type} spectrogram")
-        return self.update(50, 100, f"Computing {self.spectrogram_type} transformation")
+        return self.update_fast(50, 100, f"Computing {self.spectrogram_type} transformation")
     
     def start_optimizing(self):
         """Start LLM optimization phase"""
         self.set_stage(ProgressStage.PROCESSING, "Optimizing for LLM comprehension")
-        return self.update(75, 100, "Applying visual enhancements")
+        return self.update_fast(75, 100, "Applying visual enhancements")
     
     def start_saving(self, output_path: str):
         """Start saving phase"""
         self.set_stage(ProgressStage.SAVING, f"Saving to {output_path}")
-        return self.update(90, 100, f"Writing spectrogram image")
+        return self.update_fast(90, 100, f"Writing spectrogram image")
     
     def finish(self, output_path: str, file_size_mb: float):
         """Complete spectrogram generation"""
         self.complete(f"Spectrogram saved: {output_path} ({file_size_mb:.1f}MB)")
-        return self.update(100, 100, "Spectrogram generation complete")
+        return self.update_fast(100, 100, "Spectrogram generation complete")
 
 # Convenience functions for quick progress tracking
 def create_progress_tracker(operation: str, callback: Optional[Callable] = None) -> ProgressTracker:
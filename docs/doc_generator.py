@@ -7,117 +7,42 @@ Author: Audio Splitter Suite Team
 Version: 1.0.0
 """
 
+import os
+import sys
 import yaml
 import argparse
 import json
+import re
+import hashlib
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from jinja2 import Template
-import textwrap
+from typing import Dict, Any, List, Optional, NamedTuple, Tuple
+import jinja2
+from jinja2 import Environment, DictLoader, ModuleLoader, Template
+from functools import lru_cache, cached_property
 
-class CLIDocGenerator:
-    """
-    Generates documentation from centralized CLI data YAML file
-    Supports multiple output formats: help text, markdown, README sections
-    """
-    
-    def __init__(self, data_file: str = "docs/cli_data.yaml"):
-        """Initialize generator with YAML data file"""
-        self.data_file = Path(data_file)
-        if not self.data_file.exists():
-            raise FileNotFoundError(f"CLI data file not found: {data_file}")
-            
-        with open(self.data_file, 'r', encoding='utf-8') as f:
-            self.data = yaml.safe_load(f)
-            
-        self.metadata = self.data.get('metadata', {})
-        self.global_info = self.data.get('global_info', {})
-        self.commands = self.data.get('commands', {})
-        self.workflows = self.data.get('workflows', {})
-        self.help_info = self.data.get('help_info', {})
-        self.troubleshooting = self.data.get('troubleshooting', {})
-    
-    def generate_help_text(self, command: str = None) -> str:
-        """Generate help text for argparse integration"""
-        if command and command in self.commands:
-            return self._generate_command_help(command)
-        return self._generate_global_help()
-    
-    def _generate_global_help(self) -> str:
-        """Generate global help text"""
-        help_lines = [
-            f"{self.global_info.get('program_name', 'Audio Splitter Suite')}",
-            f"Version: {self.metadata.get('version', '2.0.0')}",
-            "",
-            self.global_info.get('description', ''),
-            "",
-            "Available Commands:",
-        ]
-        
-        for cmd_name, cmd_data in self.commands.items():
-            help_lines.append(f"  {cmd_name:<15} {cmd_data.get('description', '')}")
-        
-        help_lines.extend([
-            "",
-            "Global Options:",
-            "  --version, -v   Show version information",
-            "",
-            "Use 'python main.py COMMAND --help' for command-specific help",
-            "",
-            "Examples:",
-            f"  {self.global_info.get('executable', 'python main.py')} split audio.wav -s \"0:30-1:30:intro\"",
-            f"  {self.global_info.get('executable', 'python main.py')} convert input.wav -o output.mp3 -f mp3",
-            f"  {self.global_info.get('executable', 'python main.py')} --version"
-        ])
-        
-        return "\n".join(help_lines)
-    
-    def _generate_command_help(self, command: str) -> str:
-        """Generate help text for specific command"""
-        if command not in self.commands:
-            return f"Command '{command}' not found"
-            
-        cmd_data = self.commands[command]
-        help_lines = [
-            f"Command: {command}",
-            f"Description: {cmd_data.get('description', '')}",
-            "",
-            f"Usage: {cmd_data.get('usage', '')}",
-            ""
-        ]
-        
-        # Arguments
-        if 'arguments' in cmd_data:
-            help_lines.append("Arguments:")
-            for arg_name, arg_data in cmd_data['arguments'].items():
-                required = " (required)" if arg_data.get('required', False) else ""
-                help_lines.append(f"  {arg_name.upper():<15} {arg_data.get('description', '')}{required}")
-            help_lines.append("")
-        
-        # Options
-        if 'options' in cmd_data:
-            help_lines.append("Options:")
-            for opt_name, opt_data in cmd_data['options'].items():
-                flags = ", ".join(opt_data.get('flags', []))
-                default = f" (default: {opt_data.get('default')})" if opt_data.get('default') is not None else ""
-                help_lines.append(f"  {flags:<20} {opt_data.get('description', '')}{default}")
-            help_lines.append("")
-        
-        # Examples
-        if 'examples' in cmd_data:
-            help_lines.append("Examples:")
-            for ex_name, ex_data in cmd_data['examples'].items():
-                help_lines.append(f"  # {ex_data.get('title', '')}")
-                help_lines.append(f"  {ex_data.get('command', '')}")
-                if ex_data.get('description'):
-                    help_lines.append(f"  # {ex_data.get('description')}")
-                help_lines.append("")
-        
-        return "\n".join(help_lines)
-    
-    def generate_markdown_guide(self) -> str:
-        """Generate complete CLI guide in markdown format"""
-        template = Template("""# CLI Reference Guide - {{ global_info.program_name }}
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional accelerator; stdlib json produces the same text
+
+# libyaml-backed loader when available; the pure-Python parser is much slower
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _load_cli_data(raw: bytes) -> Dict[str, Any]:
+    """Parse CLI data YAML (libyaml-backed when available)"""
+    return yaml.load(raw, Loader=_YamlLoader)
+
+# Template sources for the markdown-family outputs
+
+_MARKDOWN_SRC = """# CLI Reference Guide - {{ global_info.program_name }}
 
 > **Generated from cli_data.yaml** - Version {{ metadata.version }}  
 > Last updated: {{ metadata.last_updated }}
@@ -144,7 +69,7 @@ class CLIDocGenerator:
 | Option | Description |
 |--------|-------------|
 {% for opt_name, opt_data in global_options.items() -%}
-| `{{ opt_data.flags | join(', ') }}` | {{ opt_data.description }} |
+| `{{ opt_data._flags_str }}` | {{ opt_data.description }} |
 {% endfor %}
 
 ## Commands Reference
@@ -152,7 +77,7 @@ class CLIDocGenerator:
 {% for cmd_name, cmd_data in commands.items() %}
 ### `{{ cmd_name }}` - {{ cmd_data.description }}
 
-**Category:** {{ cmd_data.category | replace('_', ' ') | title }}
+**Category:** {{ cmd_data._category_display }}
 
 **Usage:**
 ```bash
@@ -165,7 +90,7 @@ class CLIDocGenerator:
 | Argument | Type | Required | Description |
 |----------|------|----------|-------------|
 {% for arg_name, arg_data in cmd_data.arguments.items() -%}
-| `{{ arg_name.upper() }}` | {{ arg_data.type }} | {{ '✓' if arg_data.required else '○' }} | {{ arg_data.description }} |
+| `{{ arg_name.upper() }}` | {{ arg_data.type }} | {{ arg_data._required_mark }} | {{ arg_data.description }} |
 {% endfor %}
 {% endif %}
 
@@ -175,7 +100,7 @@ class CLIDocGenerator:
 | Flag | Type | Default | Description |
 |------|------|---------|-------------|
 {% for opt_name, opt_data in cmd_data.options.items() -%}
-| `{{ opt_data.flags | join(', ') }}` | {{ opt_data.type }} | {{ opt_data.default if opt_data.default is not none else 'None' }} | {{ opt_data.description }} |
+| `{{ opt_data._flags_str }}` | {{ opt_data.type }} | {{ opt_data.default if opt_data.default is not none else 'None' }} | {{ opt_data.description }} |
 {% endfor %}
 {% endif %}
 
@@ -228,7 +153,7 @@ class CLIDocGenerator:
 {% if sub_data.options -%}
 **Options:**
 {% for opt_name, opt_data in sub_data.options.items() -%}
-- `{{ opt_data.flags | join(', ') }}` - {{ opt_data.description }}
+- `{{ opt_data._flags_str }}` - {{ opt_data.description }}
 {% endfor %}
 {% endif %}
 
@@ -244,7 +169,7 @@ class CLIDocGenerator:
 {% for wf_name, wf_data in workflows.items() %}
 ### {{ wf_data.title }}
 
-**Category:** {{ wf_data.category | replace('_', ' ') | title }}
+**Category:** {{ wf_data._category_display }}
 
 {{ wf_data.description }}
 
@@ -289,13 +214,9 @@ class CLIDocGenerator:
 ---
 
 *Generated automatically from cli_data.yaml*
-""")
-        
-        return template.render(**self.data)
-    
-    def generate_readme_section(self) -> str:
-        """Generate CLI section for README.md"""
-        template = Template("""
+"""
+
+_README_SRC = """
 ## 🖥️ Command Line Interface
 
 {{ global_info.program_name }} provides a powerful command-line interface for all audio processing needs.
@@ -318,7 +239,7 @@ class CLIDocGenerator:
 | Command | Description | Category |
 |---------|-------------|----------|
 {% for cmd_name, cmd_data in commands.items() -%}
-| `{{ cmd_name }}` | {{ cmd_data.description }} | {{ cmd_data.category | replace('_', ' ') | title }} |
+| `{{ cmd_name }}` | {{ cmd_data.description }} | {{ cmd_data._category_display }} |
 {% endfor %}
 
 ### Quick Examples
@@ -335,7 +256,7 @@ class CLIDocGenerator:
 
 ### Professional Workflows
 
-{% for wf_name, wf_data in (workflows.items() | list)[:2] -%}
+{% for wf_name, wf_data in first2_workflows -%}
 **{{ wf_data.title }}:**
 ```bash
 # {{ wf_data.description }}
@@ -353,13 +274,9 @@ class CLIDocGenerator:
 - **Complete reference:** See [CLI Reference Guide](docs/CLI_REFERENCE.md)
 - **Examples:** See [CLI Examples](docs/CLI_EXAMPLES.md)
 
-""")
-        
-        return template.render(**self.data)
-    
-    def generate_quick_start_guide(self) -> str:
-        """Generate quick start guide"""
-        template = Template("""# Quick Start Guide - {{ global_info.program_name }}
+"""
+
+_QUICKSTART_SRC = """# Quick Start Guide - {{ global_info.program_name }}
 
 Get started with {{ global_info.program_name }} in 5 minutes.
 
@@ -386,7 +303,7 @@ Follow the menu prompts for guided operation.
 
 ## Essential Commands
 
-{% for cmd_name, cmd_data in (commands.items() | list)[:4] -%}
+{% for cmd_name, cmd_data in first4_commands -%}
 ### {{ loop.index }}. {{ cmd_data.description }}
 
 ```bash
@@ -431,13 +348,9 @@ Let's process an audio file step by step:
 ```
 
 Happy audio processing! 🎵
-""")
-        
-        return template.render(**self.data)
-    
-    def generate_examples_guide(self) -> str:
-        """Generate detailed examples guide"""
-        template = Template("""# CLI Examples Guide - {{ global_info.program_name }}
+"""
+
+_EXAMPLES_SRC = """# CLI Examples Guide - {{ global_info.program_name }}
 
 Real-world examples and use cases for {{ global_info.program_name }}.
 
@@ -569,12 +482,390 @@ mkdir -p output/{{archive,distribution,analysis}}
 ---
 
 *Need more help? Use `{{ global_info.executable }} COMMAND --help` for detailed command documentation.*
-""")
+"""
+
+_TEMPLATE_SOURCES = {
+    'markdown': _MARKDOWN_SRC,
+    'readme': _README_SRC,
+    'quickstart': _QUICKSTART_SRC,
+    'examples': _EXAMPLES_SRC,
+}
+
+# File names used when every artifact is generated in one run (--output all)
+DOCUMENT_FILES = {
+    'markdown': 'CLI_REFERENCE.md',
+    'quickstart': 'CLI_QUICK_START.md',
+    'examples': 'CLI_EXAMPLES.md',
+    'readme': 'CLI_README_SECTION.md',
+    'argparse': 'cli_argparse.json',
+}
+
+# First line of every standalone document records a hash of the sources it
+# was rendered from: the CLI data and the templates. Line endings are
+# normalized, so a CRLF checkout does not make current documents look stale
+SOURCE_HASH_HEADER = "<!-- doc_source_sha:{} -->\n"
+_SOURCE_HASH_RE = re.compile(r"<!-- doc_source_sha:([0-9a-f]+) -->")
+
+# Documents written as files of their own; the README section is embedded
+# in README.md and carries no header
+HEADER_DOCUMENTS = frozenset({'markdown', 'quickstart', 'examples'})
+
+def read_source_hash(content: Optional[str]) -> Optional[str]:
+    """Return the source hash recorded in a generated document, if any"""
+    match = _SOURCE_HASH_RE.match(content) if content else None
+    return match.group(1) if match else None
+
+def _short_digest(data: bytes) -> bytes:
+    """8-byte BLAKE2b digest"""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+@lru_cache(maxsize=None)
+def _templates_digest() -> bytes:
+    """Digest of the template sources"""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in sorted(_TEMPLATE_SOURCES):
+        digest.update(name.encode('utf-8') + b'\0' + _TEMPLATE_SOURCES[name].encode('utf-8') + b'\0')
+    return digest.digest()
+
+class ArgSpec(NamedTuple):
+    """Flat argparse specification for one command argument or option"""
+    name: str
+    kind: str  # 'positional' (YAML 'arguments') or 'option' (YAML 'options')
+    flags: Tuple[str, ...]  # Empty for positional arguments
+    type: str
+    default: Any
+    choices: Optional[Tuple[Any, ...]]
+    help: str
+    required: bool
+
+# Templates are compiled ahead of time into importable modules under the
+# user's cache directory so later CLI runs skip Jinja's lex/parse/compile
+TEMPLATE_CACHE_NAME = "audiosplitter_jinja"
+
+# Plain markdown output: no HTML escaping, and the sources never change at
+# runtime, so skip the per-lookup up-to-date check and never evict a
+# template from the (small, fixed) set
+_ENV_OPTIONS = dict(
+    autoescape=False,
+    enable_async=False,
+    auto_reload=False,
+    cache_size=-1,
+    optimized=True
+)
+
+@lru_cache(maxsize=None)
+def template_cache_dir() -> Optional[Path]:
+    """
+    Directory for compiled templates ($XDG_CACHE_HOME or ~/.cache), or None
+    
+    None means no usable cache location: templates are then compiled in memory.
+    """
+    xdg_cache = os.environ.get('XDG_CACHE_HOME')
+    if xdg_cache and os.path.isabs(xdg_cache):
+        return Path(xdg_cache) / TEMPLATE_CACHE_NAME
+    try:
+        return Path.home() / ".cache" / TEMPLATE_CACHE_NAME
+    except (RuntimeError, KeyError):
+        return None  # HOME cannot be resolved
+
+def _compiled_templates_dir(cache_dir: Path) -> Path:
+    """
+    Directory of compiled template modules under cache_dir
+    
+    Keyed by the template sources, the Jinja version and the environment
+    options, since all three shape the generated module code.
+    """
+    digest = hashlib.sha1()
+    digest.update(f"jinja2={jinja2.__version__}\0{sorted(_ENV_OPTIONS.items())!r}\0".encode('utf-8'))
+    for name in sorted(_TEMPLATE_SOURCES):
+        digest.update(name.encode('utf-8') + b'\0' + _TEMPLATE_SOURCES[name].encode('utf-8') + b'\0')
+    return cache_dir / f"compiled_{digest.hexdigest()[:16]}"
+
+def _compile_templates(target: Path) -> None:
+    """Compile every template source into target, publishing it atomically"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix='.compiling_', dir=target.parent))
+    try:
+        Environment(loader=DictLoader(_TEMPLATE_SOURCES), **_ENV_OPTIONS).compile_templates(
+            str(staging), zip=None, ignore_errors=False, log_function=None
+        )
+        try:
+            staging.rename(target)
+        except OSError:
+            if not target.is_dir():
+                raise
+            # Another process published the same templates first
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+
+@lru_cache(maxsize=None)
+def _get_environment() -> Environment:
+    """Create the shared Jinja environment for all documentation templates"""
+    cache_dir = template_cache_dir()
+    if cache_dir is None:
+        return Environment(loader=DictLoader(_TEMPLATE_SOURCES), **_ENV_OPTIONS)
+    
+    compiled_dir = _compiled_templates_dir(cache_dir)
+    try:
+        if not compiled_dir.is_dir():
+            _compile_templates(compiled_dir)
+    except OSError:
+        # Read-only cache location: compile in memory from the sources instead
+        return Environment(loader=DictLoader(_TEMPLATE_SOURCES), **_ENV_OPTIONS)
+    
+    return Environment(loader=ModuleLoader(str(compiled_dir)), **_ENV_OPTIONS)
+
+@lru_cache(maxsize=None)
+def _get_template(name: str) -> Template:
+    """Load a documentation template once per process"""
+    return _get_environment().get_template(name)
+
+def clear_template_cache() -> None:
+    """Delete the compiled templates on disk and drop the in-process copies"""
+    cache_dir = template_cache_dir()
+    if cache_dir is not None:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    _get_template.cache_clear()
+    _get_environment.cache_clear()
+
+class CLIDocGenerator:
+    """
+    Generates documentation from centralized CLI data YAML file
+    Supports multiple output formats: help text, markdown, README sections
+    """
+    
+    def __init__(self, data_file: str = "docs/cli_data.yaml"):
+        """Initialize generator with YAML data file"""
+        self.data_file = Path(data_file)
+        if not self.data_file.exists():
+            raise FileNotFoundError(f"CLI data file not found: {data_file}")
+        
+        raw = self.data_file.read_bytes()
+        self._data_digest = _short_digest(raw.replace(b'\r\n', b'\n'))
+        self._bind(_load_cli_data(raw))
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'CLIDocGenerator':
+        """
+        Create a generator from already-parsed CLI data, skipping file I/O
+        
+        Preferred when embedding the generator (tests, long-running tools)
+        so one parsed dict can back many generators. The dict gains the
+        precomputed '_'-prefixed display fields.
+        """
+        self = cls.__new__(cls)
+        self.data_file = None
+        self._data_digest = _short_digest(
+            json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+        )
+        self._bind(data)
+        return self
+    
+    def _bind(self, data: Dict[str, Any]) -> None:
+        """Attach parsed CLI data and derive the render context"""
+        self.data = data
+        
+        self.metadata = self.data.get('metadata', {})
+        self.global_info = self.data.get('global_info', {})
+        self.commands = self.data.get('commands', {})
+        self.workflows = self.data.get('workflows', {})
+        self.help_info = self.data.get('help_info', {})
+        self.troubleshooting = self.data.get('troubleshooting', {})
+        
+        self._precompute_render_fields()
+        
+        # Template context, including the short previews used by readme/quickstart
+        self._render_ctx = {
+            **self.data,
+            'first4_commands': list(self.commands.items())[:4],
+            'first2_workflows': list(self.workflows.items())[:2],
+        }
+    
+    def _precompute_render_fields(self) -> None:
+        """Derive display strings once so templates only fetch attributes"""
+        for entry in (*self.commands.values(), *self.workflows.values()):
+            entry['_category_display'] = entry.get('category', '').replace('_', ' ').title()
+        
+        option_groups = [self.data.get('global_options', {})]
+        for cmd_data in self.commands.values():
+            for arg_data in (cmd_data.get('arguments') or {}).values():
+                arg_data['_required_mark'] = '✓' if arg_data.get('required') else '○'
+            option_groups.append(cmd_data.get('options') or {})
+            for sub_data in (cmd_data.get('subcommands') or {}).values():
+                option_groups.append(sub_data.get('options') or {})
+        
+        for options in option_groups:
+            for opt_data in options.values():
+                opt_data['_flags_str'] = ', '.join(opt_data.get('flags', ()))
+    
+    def generate_help_text(self, command: str = None) -> str:
+        """Generate help text for argparse integration"""
+        if command and command in self.commands:
+            return self._generate_command_help(command)
+        return self._generate_global_help()
+    
+    def _generate_global_help(self) -> str:
+        """Generate global help text"""
+        executable = self.global_info.get('executable', 'python main.py')
+        command_line = "  {:<15} {}".format
+        
+        return "\n".join((
+            f"{self.global_info.get('program_name', 'Audio Splitter Suite')}",
+            f"Version: {self.metadata.get('version', '2.0.0')}",
+            "",
+            self.global_info.get('description', ''),
+            "",
+            "Available Commands:",
+            *(command_line(cmd_name, cmd_data.get('description', ''))
+              for cmd_name, cmd_data in self.commands.items()),
+            "",
+            "Global Options:",
+            "  --version, -v   Show version information",
+            "",
+            "Use 'python main.py COMMAND --help' for command-specific help",
+            "",
+            "Examples:",
+            f"  {executable} split audio.wav -s \"0:30-1:30:intro\"",
+            f"  {executable} convert input.wav -o output.mp3 -f mp3",
+            f"  {executable} --version"
+        ))
+    
+    def _generate_command_help(self, command: str) -> str:
+        """Generate help text for specific command"""
+        if command not in self.commands:
+            return f"Command '{command}' not found"
         
-        return template.render(**self.data)
+        return "\n".join(self._iter_command_help(command, self.commands[command]))
+    
+    @staticmethod
+    def _iter_command_help(command: str, cmd_data: Dict[str, Any]):
+        """Yield the help text lines for a single command"""
+        yield f"Command: {command}"
+        yield f"Description: {cmd_data.get('description', '')}"
+        yield ""
+        yield f"Usage: {cmd_data.get('usage', '')}"
+        yield ""
+        
+        # Arguments
+        if 'arguments' in cmd_data:
+            yield "Arguments:"
+            arg_line = "  {:<15} {}{}".format
+            for arg_name, arg_data in cmd_data['arguments'].items():
+                required = " (required)" if arg_data.get('required', False) else ""
+                yield arg_line(arg_name.upper(), arg_data.get('description', ''), required)
+            yield ""
+        
+        # Options
+        if 'options' in cmd_data:
+            yield "Options:"
+            opt_line = "  {:<20} {}{}".format
+            for opt_data in cmd_data['options'].values():
+                default = opt_data.get('default')
+                default = f" (default: {default})" if default is not None else ""
+                yield opt_line(opt_data['_flags_str'], opt_data.get('description', ''), default)
+            yield ""
+        
+        # Examples
+        if 'examples' in cmd_data:
+            yield "Examples:"
+            for ex_data in cmd_data['examples'].values():
+                yield f"  # {ex_data.get('title', '')}"
+                yield f"  {ex_data.get('command', '')}"
+                if ex_data.get('description'):
+                    yield f"  # {ex_data.get('description')}"
+                yield ""
+    
+    def generate_markdown_guide(self) -> str:
+        """Generate complete CLI guide in markdown format"""
+        return _get_template('markdown').render(**self._render_ctx)
+    
+    def generate_readme_section(self) -> str:
+        """Generate CLI section for README.md"""
+        return _get_template('readme').render(**self._render_ctx)
+    
+    def generate_quick_start_guide(self) -> str:
+        """Generate quick start guide"""
+        return _get_template('quickstart').render(**self._render_ctx)
+    
+    def generate_examples_guide(self) -> str:
+        """Generate detailed examples guide"""
+        return _get_template('examples').render(**self._render_ctx)
+    
+    @cached_property
+    def source_hash(self) -> str:
+        """Short hash of the sources the documents are rendered from (data, templates)"""
+        return hashlib.blake2b(self._data_digest + _templates_digest(), digest_size=8).hexdigest()
+    
+    def _document_header(self, output_type: str) -> str:
+        """Source hash header for standalone documents, '' for the README section"""
+        return SOURCE_HASH_HEADER.format(self.source_hash) if output_type in HEADER_DOCUMENTS else ''
+    
+    def render_document(self, output_type: str) -> str:
+        """
+        Render a markdown-family document ('markdown', 'readme', 'quickstart'
+        or 'examples') to a string, headed by its source hash
+        """
+        return self._document_header(output_type) + _get_template(output_type).render(**self._render_ctx)
+    
+    def stream_document(self, output_type: str, fp) -> None:
+        """
+        Render a markdown-family document ('markdown', 'readme', 'quickstart'
+        or 'examples') directly into an open text file without building the
+        whole string in memory
+        """
+        fp.write(self._document_header(output_type))
+        _get_template(output_type).stream(**self._render_ctx).dump(fp)
+    
+    def write_all(self, output_dir: str = "docs") -> List[Path]:
+        """
+        Generate every documentation artifact into output_dir in one pass
+        
+        Returns:
+            Paths of the written files, in DOCUMENT_FILES order
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        written = []
+        for output_type, file_name in DOCUMENT_FILES.items():
+            output_path = output_dir / file_name
+            if output_type == 'argparse':
+                output_path.write_bytes(_dump_json(self.argparse_data))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as fp:
+                    self.stream_document(output_type, fp)
+            written.append(output_path)
+        
+        return written
     
     def generate_argparse_data(self) -> Dict[str, Any]:
         """Generate structured data for argparse integration"""
+        return self.argparse_data
+    
+    @cached_property
+    def argparse_specs(self) -> Dict[str, Tuple[ArgSpec, ...]]:
+        """Per-command flat argument/option specs, positional arguments first"""
+        specs = {}
+        for cmd_name, cmd_data in self.commands.items():
+            arguments = (
+                ArgSpec(arg_name, 'positional', (), arg_data.get('type', 'str'), None, None,
+                        arg_data.get('description', ''), arg_data.get('required', False))
+                for arg_name, arg_data in (cmd_data.get('arguments') or {}).items()
+            )
+            options = (
+                ArgSpec(opt_name, 'option', tuple(opt_data.get('flags', ())),
+                        opt_data.get('type', 'str'), opt_data.get('default'),
+                        tuple(opt_data['choices']) if opt_data.get('choices') is not None else None,
+                        opt_data.get('description', ''), opt_data.get('required', False))
+                for opt_name, opt_data in (cmd_data.get('options') or {}).items()
+            )
+            specs[cmd_name] = (*arguments, *options)
+        return specs
+    
+    @cached_property
+    def argparse_data(self) -> Dict[str, Any]:
+        """Structured argparse data (JSON-ready view of argparse_specs), built once"""
         parser_data = {
             'program_name': self.global_info.get('program_name', 'Audio Splitter Suite'),
             'description': self.global_info.get('description', ''),
@@ -582,44 +873,40 @@ mkdir -p output/{{archive,distribution,analysis}}
             'commands': {}
         }
         
-        for cmd_name, cmd_data in self.commands.items():
-            cmd_parser_data = {
+        for cmd_name, cmd_specs in self.argparse_specs.items():
+            description = self.commands[cmd_name].get('description', '')
+            parser_data['commands'][cmd_name] = {
                 'name': cmd_name,
-                'help': cmd_data.get('description', ''),
-                'description': cmd_data.get('description', ''),
-                'arguments': [],
-                'options': []
+                'help': description,
+                'description': description,
+                'arguments': [
+                    {'name': spec.name, 'help': spec.help, 'type': spec.type,
+                     'required': spec.required}
+                    for spec in cmd_specs if spec.kind == 'positional'
+                ],
+                # Lists, as in the YAML: the specs hold tuples only to stay immutable
+                'options': [
+                    {'name': spec.name, 'flags': list(spec.flags), 'help': spec.help,
+                     'type': spec.type, 'default': spec.default,
+                     'choices': list(spec.choices) if spec.choices is not None else None,
+                     'required': spec.required}
+                    for spec in cmd_specs if spec.kind == 'option'
+                ]
             }
-            
-            # Add arguments
-            if 'arguments' in cmd_data:
-                for arg_name, arg_data in cmd_data['arguments'].items():
-                    arg_info = {
-                        'name': arg_name,
-                        'help': arg_data.get('description', ''),
-                        'type': arg_data.get('type', 'str'),
-                        'required': arg_data.get('required', False)
-                    }
-                    cmd_parser_data['arguments'].append(arg_info)
-            
-            # Add options
-            if 'options' in cmd_data:
-                for opt_name, opt_data in cmd_data['options'].items():
-                    opt_info = {
-                        'name': opt_name,
-                        'flags': opt_data.get('flags', []),
-                        'help': opt_data.get('description', ''),
-                        'type': opt_data.get('type', 'str'),
-                        'default': opt_data.get('default'),
-                        'choices': opt_data.get('choices'),
-                        'required': opt_data.get('required', False)
-                    }
-                    cmd_parser_data['options'].append(opt_info)
-            
-            parser_data['commands'][cmd_name] = cmd_parser_data
         
         return parser_data
 
+def _write_stdout(payload: bytes) -> None:
+    """Write already-encoded output straight to stdout's binary buffer"""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. captured in tests)
+        sys.stdout.write(payload.decode('utf-8'))
+        return
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
+
 def main():
     """CLI interface for the documentation generator"""
     parser = argparse.ArgumentParser(
@@ -629,9 +916,9 @@ def main():
     
     parser.add_argument(
         '--output', 
-        choices=['help', 'markdown', 'readme', 'quickstart', 'examples', 'argparse'],
+        choices=['help', 'markdown', 'readme', 'quickstart', 'examples', 'argparse', 'all'],
         required=True,
-        help='Type of documentation to generate'
+        help='Type of documentation to generate (all: every artifact into --outdir)'
     )
     
     parser.add_argument(
@@ -644,6 +931,12 @@ def main():
         help='Output file path'
     )
     
+    parser.add_argument(
+        '--outdir',
+        default='docs',
+        help='Output directory for --output all'
+    )
+    
     parser.add_argument(
         '--data-file',
         default='docs/cli_data.yaml',
@@ -655,26 +948,34 @@ def main():
     try:
         generator = CLIDocGenerator(args.data_file)
         
+        if args.output == 'all':
+            for output_path in generator.write_all(args.outdir):
+                print(f"✅ Documentation generated: {output_path}")
+            return 0
+        
+        # Template outputs written to a file are streamed chunk by chunk
+        if args.file and args.output in _TEMPLATE_SOURCES:
+            output_path = Path(args.file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as fp:
+                generator.stream_document(args.output, fp)
+            print(f"✅ Documentation generated: {args.file}")
+            return 0
+        
         if args.output == 'help':
-            content = generator.generate_help_text(args.command)
-        elif args.output == 'markdown':
-            content = generator.generate_markdown_guide()
-        elif args.output == 'readme':
-            content = generator.generate_readme_section()
-        elif args.output == 'quickstart':
-            content = generator.generate_quick_start_guide()
-        elif args.output == 'examples':
-            content = generator.generate_examples_guide()
+            content = generator.generate_help_text(args.command).encode('utf-8')
+        elif args.output in _TEMPLATE_SOURCES:
+            content = generator.render_document(args.output).encode('utf-8')
         elif args.output == 'argparse':
-            content = json.dumps(generator.generate_argparse_data(), indent=2)
+            content = _dump_json(generator.argparse_data)
         
         if args.file:
             output_path = Path(args.file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content, encoding='utf-8')
+            output_path.write_bytes(content)
             print(f"✅ Documentation generated: {args.file}")
         else:
-            print(content)
+            _write_stdout(content + b'\n')
             
     except Exception as e:
         print(f"❌ Error generating documentation: {e}")
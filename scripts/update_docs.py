@@ -10,28 +10,96 @@ This script regenerates all CLI documentation automatically:
 - README.md CLI section (between markers)
 
 Usage:
-    python scripts/update_docs.py [--force] [--check-only]
+    python scripts/update_docs.py [--force] [--check-only] [--clear-template-cache]
 """
 
-import subprocess
+import os
+import stat
 import sys
+import tempfile
 import argparse
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, NamedTuple, Optional
 import re
 
-def run_command(cmd: List[str], capture_output: bool = True) -> Tuple[int, str, str]:
-    """Run command and return (returncode, stdout, stderr)"""
-    try:
-        result = subprocess.run(
-            cmd, 
-            capture_output=capture_output, 
-            text=True,
-            cwd=Path(__file__).parent.parent  # Run from project root
-        )
-        return result.returncode, result.stdout, result.stderr
-    except Exception as e:
-        return 1, "", str(e)
+PROJECT_ROOT = Path(__file__).parent.parent
+DOCS_DIR = PROJECT_ROOT / "docs"
+CLI_DATA_PATH = DOCS_DIR / "cli_data.yaml"
+
+# Generated documents, relative to the project root
+DOC_FILES = (
+    "docs/CLI_REFERENCE.md",
+    "docs/CLI_QUICK_START.md",
+    "docs/CLI_EXAMPLES.md",
+)
+
+README_START_MARKER = "<!-- CLI_SECTION_START -->"
+README_END_MARKER = "<!-- CLI_SECTION_END -->"
+
+# First marker pair and everything between them, matched in a single pass
+_README_CLI_RE = re.compile(
+    f"({re.escape(README_START_MARKER)})(.*?)({re.escape(README_END_MARKER)})",
+    re.DOTALL
+)
+
+def _read_umask() -> int:
+    """Return the process umask (os.umask can only be read by setting it)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+# Read once at import: documents are written from several threads, and
+# toggling the umask there would race
+_UMASK = _read_umask()
+
+class DocFile(NamedTuple):
+    """A documentation file as read from disk"""
+    path: Path
+    content: Optional[str]  # None if the file is missing or unreadable
+    error: Optional[Exception] = None
+
+def read_doc_files() -> Dict[str, DocFile]:
+    """
+    Read the generated documents and README.md once, keyed by relative path
+    
+    The sync check, incremental generation and validation all work from
+    this snapshot instead of each re-opening the files.
+    """
+    docs = {}
+    for file_path in (*DOC_FILES, "README.md"):
+        path = PROJECT_ROOT / file_path
+        try:
+            docs[file_path] = DocFile(path, path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            docs[file_path] = DocFile(path, None)
+        except Exception as e:
+            docs[file_path] = DocFile(path, None, e)
+    return docs
+
+@lru_cache(maxsize=4)
+def _load_doc_generator(data_file: str, mtime_ns: int):
+    """Build a generator for one version of the CLI data (keyed by mtime)"""
+    return _import_doc_generator().CLIDocGenerator(data_file)
+
+def _import_doc_generator():
+    """Import docs/doc_generator.py as a module"""
+    if str(DOCS_DIR) not in sys.path:
+        sys.path.insert(0, str(DOCS_DIR))
+    import doc_generator
+    return doc_generator
+
+def get_doc_generator():
+    """
+    Return the shared documentation generator for cli_data.yaml
+    
+    Every output is rendered from this single generator instead of spawning
+    a doc_generator.py subprocess (and a fresh YAML parse) per document; the
+    YAML is only re-parsed after it has been modified.
+    """
+    return _load_doc_generator(str(CLI_DATA_PATH), CLI_DATA_PATH.stat().st_mtime_ns)
 
 def check_dependencies() -> bool:
     """Check if required dependencies are available"""
@@ -50,17 +118,87 @@ def check_dependencies() -> bool:
         return False
     
     # Check if Python dependencies are available
-    returncode, _, stderr = run_command([sys.executable, "-c", "import yaml, jinja2"])
-    if returncode != 0:
-        print(f"❌ Missing Python dependencies: {stderr}")
+    missing = [name for name in ("yaml", "jinja2") if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing Python dependencies: {', '.join(missing)}")
         print("Install with: pip install pyyaml jinja2")
         return False
     
     print("✅ All dependencies OK")
     return True
 
-def generate_documentation() -> bool:
-    """Generate all documentation files"""
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write content to path unless the file already holds exactly these bytes
+    
+    Skipping no-op writes keeps mtimes (and git's view of the tree) stable.
+    
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    new_bytes = content.encode('utf-8')
+    try:
+        if path.read_bytes() == new_bytes:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(path, new_bytes)
+    return True
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write data to a temporary file next to path and rename it into place
+    
+    The file contents are fsynced before the rename, so after a crash path
+    holds either the old or the new contents, never a partial file. An
+    existing file's permission bits are kept.
+    """
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.",
+                                      suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        try:
+            os.chmod(tmp.name, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            # New file: the usual umask-based mode instead of mkstemp's 0600
+            os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory's entries (the renames above) to disk, where supported"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # e.g. Windows cannot open directories
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _write_document(generator, output_type: str, file_path: str) -> bool:
+    """Render one markdown document (with its source hash header) and write it if it changed"""
+    return write_if_changed(PROJECT_ROOT / file_path, generator.render_document(output_type))
+
+def generate_documentation(force: bool = True, docs: Optional[Dict[str, DocFile]] = None) -> bool:
+    """
+    Generate all documentation files
+    
+    Args:
+        force: Regenerate every file; otherwise skip files already generated
+            from the current cli_data.yaml and doc_generator.py
+        docs: Snapshot from read_doc_files() (read on demand if omitted)
+    """
     print("📚 Generating documentation files...")
     
     docs_to_generate = [
@@ -69,23 +207,53 @@ def generate_documentation() -> bool:
         ("examples", "docs/CLI_EXAMPLES.md", "Examples Guide")
     ]
     
-    success = True
+    try:
+        generator = get_doc_generator()
+        source_hash = generator.source_hash
+    except Exception as e:
+        print(f"  ❌ Failed to load CLI data: {e}")
+        return False
+    read_source_hash = _import_doc_generator().read_source_hash
     
-    for output_type, file_path, description in docs_to_generate:
-        print(f"  📝 Generating {description}...")
-        
-        returncode, stdout, stderr = run_command([
-            sys.executable, "docs/doc_generator.py",
-            "--output", output_type,
-            "--file", file_path
-        ])
+    if not force and docs is None:
+        docs = read_doc_files()
+    
+    success = True
+    written = False
+    
+    # The documents are independent (shared read-only data, distinct output
+    # files), so render and write them concurrently; results are still
+    # reported in the order above
+    with ThreadPoolExecutor(max_workers=len(docs_to_generate)) as executor:
+        futures = []
+        for output_type, file_path, _ in docs_to_generate:
+            if not force and read_source_hash(docs[file_path].content) == source_hash:
+                futures.append(None)
+            else:
+                futures.append(executor.submit(_write_document, generator, output_type,
+                                               file_path))
         
-        if returncode == 0:
-            print(f"    ✅ {description} generated successfully")
-        else:
-            print(f"    ❌ Failed to generate {description}")
-            print(f"    Error: {stderr}")
-            success = False
+        for (_, _, description), future in zip(docs_to_generate, futures):
+            print(f"  📝 Generating {description}...")
+            
+            if future is None:
+                print(f"    🟰 {description} already up to date")
+                continue
+            
+            try:
+                if future.result():
+                    written = True
+                    print(f"    ✅ {description} generated successfully")
+                else:
+                    print(f"    🟰 {description} unchanged")
+            except Exception as e:
+                print(f"    ❌ Failed to generate {description}")
+                print(f"    Error: {e}")
+                success = False
+    
+    # One directory sync for all renames instead of one per file
+    if written:
+        _fsync_dir(DOCS_DIR)
     
     return success
 
@@ -94,13 +262,10 @@ def update_readme_section() -> bool:
     print("📖 Updating README.md CLI section...")
     
     # Generate README section content
-    returncode, readme_section, stderr = run_command([
-        sys.executable, "docs/doc_generator.py",
-        "--output", "readme"
-    ])
-    
-    if returncode != 0:
-        print(f"❌ Failed to generate README section: {stderr}")
+    try:
+        readme_section = get_doc_generator().generate_readme_section()
+    except Exception as e:
+        print(f"❌ Failed to generate README section: {e}")
         return False
     
     # Read current README
@@ -115,121 +280,108 @@ def update_readme_section() -> bool:
         print(f"❌ Error reading README.md: {e}")
         return False
     
-    # Find markers
-    start_marker = "<!-- CLI_SECTION_START -->"
-    end_marker = "<!-- CLI_SECTION_END -->"
+    # Replace section between markers
+    new_content, replaced = _README_CLI_RE.subn(
+        lambda m: f"{m.group(1)}\n{readme_section.strip()}\n{m.group(3)}",
+        readme_content,
+        count=1
+    )
     
-    if start_marker not in readme_content or end_marker not in readme_content:
+    if not replaced:
         print(f"❌ CLI section markers not found in README.md")
         print(f"Add these markers where you want the CLI section:")
-        print(f"  {start_marker}")
-        print(f"  {end_marker}")
+        print(f"  {README_START_MARKER}")
+        print(f"  {README_END_MARKER}")
         return False
     
-    # Replace section between markers
     try:
-        before = readme_content.split(start_marker)[0]
-        after = readme_content.split(end_marker)[1]
-        
-        new_content = f"{before}{start_marker}\n{readme_section.strip()}\n{end_marker}{after}"
-        
-        readme_path.write_text(new_content, encoding='utf-8')
-        print("    ✅ README.md CLI section updated successfully")
+        if write_if_changed(readme_path, new_content):
+            _fsync_dir(readme_path.parent)
+            print("    ✅ README.md CLI section updated successfully")
+        else:
+            print("    🟰 README.md CLI section unchanged")
         return True
         
     except Exception as e:
         print(f"❌ Error updating README.md: {e}")
         return False
 
-def check_documentation_sync() -> bool:
-    """Check if documentation is in sync with cli_data.yaml"""
+def check_documentation_sync(docs: Optional[Dict[str, DocFile]] = None) -> bool:
+    """Check if documentation was generated from the current cli_data.yaml and generator"""
     print("🔄 Checking documentation synchronization...")
     
-    cli_data_path = Path(__file__).parent.parent / "docs" / "cli_data.yaml"
+    try:
+        source_hash = get_doc_generator().source_hash
+    except Exception as e:
+        print(f"    ❌ Error reading {CLI_DATA_PATH}: {e}")
+        return False
+    read_source_hash = _import_doc_generator().read_source_hash
     
-    files_to_check = [
-        "docs/CLI_REFERENCE.md",
-        "docs/CLI_QUICK_START.md", 
-        "docs/CLI_EXAMPLES.md"
-    ]
+    if docs is None:
+        docs = read_doc_files()
     
     all_synced = True
     
-    for file_path in files_to_check:
-        doc_path = Path(__file__).parent.parent / file_path
+    for file_path in DOC_FILES:
+        doc = docs[file_path]
         
-        if not doc_path.exists():
+        if doc.error is not None:
+            print(f"    ❌ Error checking {file_path}: {doc.error}")
+            all_synced = False
+        elif doc.content is None:
             print(f"    ⚠️ Documentation file missing: {file_path}")
             all_synced = False
-            continue
-        
-        # Check if doc file is newer than cli_data.yaml
-        try:
-            doc_mtime = doc_path.stat().st_mtime
-            cli_data_mtime = cli_data_path.stat().st_mtime
-            
-            if cli_data_mtime > doc_mtime:
-                print(f"    ⚠️ Documentation outdated: {file_path}")
-                all_synced = False
-            else:
-                print(f"    ✅ Documentation up to date: {file_path}")
-                
-        except Exception as e:
-            print(f"    ❌ Error checking {file_path}: {e}")
+        # Compare the source hash recorded at generation time; mtimes are
+        # meaningless after a fresh checkout
+        elif read_source_hash(doc.content) != source_hash:
+            print(f"    ⚠️ Documentation outdated: {file_path}")
             all_synced = False
+        else:
+            print(f"    ✅ Documentation up to date: {file_path}")
     
     return all_synced
 
-def validate_generated_docs() -> bool:
+def validate_generated_docs(docs: Optional[Dict[str, DocFile]] = None) -> bool:
     """Validate that generated documentation is correct"""
     print("🔍 Validating generated documentation...")
     
-    # Check that all expected files exist
-    expected_files = [
-        "docs/CLI_REFERENCE.md",
-        "docs/CLI_QUICK_START.md",
-        "docs/CLI_EXAMPLES.md"
-    ]
+    if docs is None:
+        docs = read_doc_files()
     
     all_valid = True
     
-    for file_path in expected_files:
-        doc_path = Path(__file__).parent.parent / file_path
+    # Check that all expected files exist
+    for file_path in DOC_FILES:
+        doc = docs[file_path]
+        content = doc.content
         
-        if not doc_path.exists():
+        if doc.error is not None:
+            print(f"    ❌ Error reading {file_path}: {doc.error}")
+            all_valid = False
+        elif content is None:
             print(f"    ❌ Missing: {file_path}")
             all_valid = False
-            continue
-            
-        try:
-            content = doc_path.read_text(encoding='utf-8')
-            
-            # Basic validation checks
-            if len(content) < 100:
-                print(f"    ⚠️ Suspiciously short: {file_path} ({len(content)} chars)")
-                all_valid = False
-            elif "Audio Splitter Suite" not in content:
-                print(f"    ⚠️ Missing project name in: {file_path}")
-                all_valid = False
-            else:
-                print(f"    ✅ Valid: {file_path} ({len(content)} chars)")
-                
-        except Exception as e:
-            print(f"    ❌ Error reading {file_path}: {e}")
+        # Basic validation checks
+        elif len(content) < 100:
+            print(f"    ⚠️ Suspiciously short: {file_path} ({len(content)} chars)")
+            all_valid = False
+        elif "Audio Splitter Suite" not in content:
+            print(f"    ⚠️ Missing project name in: {file_path}")
             all_valid = False
+        else:
+            print(f"    ✅ Valid: {file_path} ({len(content)} chars)")
     
     # Check README CLI section
-    readme_path = Path(__file__).parent.parent / "README.md"
-    if readme_path.exists():
-        try:
-            readme_content = readme_path.read_text(encoding='utf-8')
-            if "<!-- CLI_SECTION_START -->" in readme_content and "<!-- CLI_SECTION_END -->" in readme_content:
-                print("    ✅ README.md CLI section markers present")
-            else:
-                print("    ⚠️ README.md CLI section markers missing")
-                all_valid = False
-        except Exception as e:
-            print(f"    ❌ Error checking README.md: {e}")
+    readme = docs["README.md"]
+    if readme.error is not None:
+        print(f"    ❌ Error checking README.md: {readme.error}")
+        all_valid = False
+    elif readme.content is not None:
+        # Same single-pass match update_readme_section() relies on
+        if _README_CLI_RE.search(readme.content):
+            print("    ✅ README.md CLI section markers present")
+        else:
+            print("    ⚠️ README.md CLI section markers missing")
             all_valid = False
     
     return all_valid
@@ -244,6 +396,9 @@ Examples:
     python scripts/update_docs.py                    # Update all documentation
     python scripts/update_docs.py --check-only       # Only check if docs are synced
     python scripts/update_docs.py --force            # Force regeneration even if up to date
+
+Templates are compiled once into $XDG_CACHE_HOME/audiosplitter_jinja (default
+~/.cache) and reused by later runs; --clear-template-cache forces a recompile.
         """
     )
     
@@ -265,6 +420,12 @@ Examples:
         help='Only validate existing documentation, do not update'
     )
     
+    parser.add_argument(
+        '--clear-template-cache',
+        action='store_true',
+        help='Delete the compiled Jinja2 templates ($XDG_CACHE_HOME/audiosplitter_jinja) before running'
+    )
+    
     args = parser.parse_args()
     
     print("📚 Audio Splitter Suite - Documentation Updater")
@@ -274,6 +435,10 @@ Examples:
     if not check_dependencies():
         return 1
     
+    if args.clear_template_cache:
+        _import_doc_generator().clear_template_cache()
+        print("🧹 Template cache cleared")
+    
     # Validation only mode
     if args.validate_only:
         if validate_generated_docs():
@@ -293,8 +458,9 @@ Examples:
             return 1
     
     # Check if update is needed (unless forced)
+    docs = read_doc_files()
     if not args.force:
-        if check_documentation_sync():
+        if check_documentation_sync(docs):
             print("\n✅ Documentation is already up to date")
             print("Use --force to regenerate anyway")
             return 0
@@ -302,7 +468,7 @@ Examples:
     print("\n🔄 Updating documentation...")
     
     # Generate documentation files
-    if not generate_documentation():
+    if not generate_documentation(force=args.force, docs=docs):
         print("\n❌ Failed to generate documentation files")
         return 1
     
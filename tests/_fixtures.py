@@ -0,0 +1,96 @@
+"""
+Fixtures de audio compartidos por los tests
+
+Los WAV son deterministas y se escriben una sola vez por sesión en un
+directorio temporal propio, que se borra al salir del intérprete.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+import wave
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+SAMPLE_RATE = 44100
+
+_fixtures_dir: Optional[Path] = None
+
+# run_tests() ejecuta las clases en hilos: lru_cache no evita que dos hilos
+# generen el mismo archivo (ni el mismo directorio) a la vez
+_FIXTURES_LOCK = threading.Lock()
+
+
+def get_fixture_dir() -> Path:
+    """Directorio de fixtures de esta sesión (creado en la primera llamada)"""
+    global _fixtures_dir
+    with _FIXTURES_LOCK:
+        if _fixtures_dir is None:
+            _fixtures_dir = Path(tempfile.mkdtemp(prefix="audio_splitter_fixtures_"))
+            atexit.register(shutil.rmtree, _fixtures_dir, ignore_errors=True)
+        return _fixtures_dir
+
+
+def _write_pcm16(path: Path, channels: int, pcm: bytes):
+    """Escribir frames PCM 16-bit como WAV a un temporal y renombrar"""
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.",
+                                     suffix=".tmp", delete=False) as tmp_file:
+        try:
+            with wave.open(tmp_file, 'wb') as wav_file:
+                wav_file.setnchannels(channels)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(SAMPLE_RATE)
+                wav_file.writeframes(pcm)
+        except BaseException:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+    # Solo lectura: los tests enlazan los fixtures (hardlink) en vez de copiarlos
+    os.chmod(tmp_file.name, 0o444)
+    os.replace(tmp_file.name, path)
+
+
+@lru_cache(maxsize=None)
+def get_sine_wav(duration: float, channels: int, freq: float = 440.0,
+                 right_freq: Optional[float] = None) -> Path:
+    """
+    Ruta de un WAV senoidal (amplitud 0.5) de duration segundos
+
+    En stereo el canal derecho usa right_freq (por defecto freq * 1.01,
+    ligeramente diferente).
+    """
+    # numpy solo hace falta al generar: los tests de construcción no lo importan
+    import numpy as np
+
+    if right_freq is None:
+        right_freq = freq * 1.01
+    path = get_fixture_dir() / f"sine_{freq:g}_{right_freq:g}hz_{duration:g}s_{channels}ch.wav"
+    frames = int(SAMPLE_RATE * duration)
+
+    # Cada canal se escribe directamente en su columna del buffer y la fase
+    # se calcula una sola vez
+    data = np.empty((frames, channels), dtype=np.float32)
+    phase = np.arange(frames, dtype=np.float32)
+    phase *= np.float32(2 * np.pi * freq / SAMPLE_RATE)
+    np.sin(phase, out=data[:, 0])
+    if channels > 1:
+        phase *= np.float32(right_freq / freq)
+        np.sin(phase, out=data[:, 1])
+    data *= np.float32(0.5 * 32767)
+
+    with _FIXTURES_LOCK:
+        _write_pcm16(path, channels, data.astype('<i2').tobytes())
+    return path
+
+
+@lru_cache(maxsize=None)
+def get_silent_wav(duration: float, channels: int) -> Path:
+    """Ruta de un WAV de silencio de duration segundos"""
+    path = get_fixture_dir() / f"silence_{duration:g}s_{channels}ch.wav"
+    frames = int(SAMPLE_RATE * duration)
+    with _FIXTURES_LOCK:
+        _write_pcm16(path, channels, bytes(frames * channels * 2))
+    return path
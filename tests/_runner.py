@@ -0,0 +1,36 @@
+"""
+Runner compartido por los run_tests() de los módulos de tests
+
+Ejecuta cada clase de tests con su propio runner en un hilo, capturando la
+salida para imprimirla en orden.
+"""
+
+import io
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence, Tuple, Type
+
+
+def _run_test_case(test_case: Type[unittest.TestCase]) -> Tuple[bool, str]:
+    """Ejecutar una clase de tests con su propio runner, capturando la salida"""
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_case)
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
+def run_test_cases(test_cases: Sequence[Type[unittest.TestCase]]) -> bool:
+    """
+    Ejecutar las clases de tests en paralelo
+
+    Las clases deben ser independientes entre sí (cada una con sus propios
+    archivos temporales); la salida se imprime en el orden de test_cases.
+    """
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        outcomes = list(executor.map(_run_test_case, test_cases))
+
+    for _, output in outcomes:
+        sys.stderr.write(output)
+
+    return all(success for success, _ in outcomes)
@@ -6,9 +6,11 @@ Testing de operaciones batch para todos los módulos
 
 import unittest
 import sys
+import os
+import tempfile
+import threading
+import uuid
 from pathlib import Path
-import numpy as np
-import soundfile as sf
 import shutil
 
 # Add project root to path
@@ -20,6 +22,53 @@ from audio_splitter.core.batch_processor import (
     BatchOperation
 )
 
+from tests._fixtures import get_sine_wav
+from tests._runner import run_test_cases
+
+
+_CLEANUP_THREADS = []
+
+
+def tearDownModule():
+    """Esperar a los borrados en segundo plano lanzados por las clases"""
+    for thread in list(_CLEANUP_THREADS):
+        thread.join(timeout=30)
+
+
+def _discard_dir(path):
+    """
+    Eliminar un directorio de prueba sin bloquear al runner
+
+    En POSIX se renombra (atómico) y se borra en un hilo de fondo, de modo
+    que los unlink se solapan con el setUpClass de la siguiente clase.
+    """
+    if not path.exists():
+        return
+    if os.name != "posix":
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    trash = path.with_name(f"{path.name}.trash.{os.getpid()}.{uuid.uuid4().hex}")
+    path.rename(trash)
+    thread = threading.Thread(target=shutil.rmtree, args=(trash,),
+                              kwargs={"ignore_errors": True}, daemon=True)
+    thread.start()
+    _CLEANUP_THREADS.append(thread)
+
+
+def _link_fixture(source, target):
+    """
+    Colocar el WAV compartido source en target (hardlink, o copia si no es posible)
+
+    Los fixtures compartidos son de solo lectura, así que un test no puede
+    modificar a través del hardlink la entrada de los demás.
+    """
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+    return target
+
 
 class TestBatchProcessor(unittest.TestCase):
     """Tests para Universal Batch Processor"""
@@ -27,40 +76,26 @@ class TestBatchProcessor(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Crear archivos de prueba"""
-        cls.test_dir = Path("/tmp/batch_test")
-        cls.test_dir.mkdir(exist_ok=True)
+        cls.test_dir = Path(tempfile.mkdtemp(prefix="batch_test_"))
 
         # Crear subdirectorio
         cls.subdir = cls.test_dir / "subdir"
         cls.subdir.mkdir(exist_ok=True)
 
-        # Crear múltiples archivos de audio de prueba
-        sample_rate = 44100
-        duration = 2.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
-
-        # Archivo 1: stereo
-        left = 0.5 * np.sin(2 * np.pi * 440 * t)
-        right = 0.5 * np.sin(2 * np.pi * 554 * t)
-        stereo = np.column_stack((left, right))
-        cls.file1 = cls.test_dir / "test1.wav"
-        sf.write(str(cls.file1), stereo, sample_rate)
-
-        # Archivo 2: stereo
-        cls.file2 = cls.test_dir / "test2.wav"
-        sf.write(str(cls.file2), stereo, sample_rate)
+        # Crear múltiples archivos de audio de prueba (stereo, 2 s, 440/554 Hz)
+        source = get_sine_wav(2.0, 2, 440.0, 554.0)
+        cls.file1 = _link_fixture(source, cls.test_dir / "test1.wav")
+        cls.file2 = _link_fixture(source, cls.test_dir / "test2.wav")
 
         # Archivo 3: en subdirectorio
-        cls.file3 = cls.subdir / "test3.wav"
-        sf.write(str(cls.file3), stereo, sample_rate)
+        cls.file3 = _link_fixture(source, cls.subdir / "test3.wav")
 
         cls.processor = UniversalBatchProcessor()
 
     @classmethod
     def tearDownClass(cls):
         """Limpiar archivos de prueba"""
-        if cls.test_dir.exists():
-            shutil.rmtree(cls.test_dir)
+        _discard_dir(cls.test_dir)
 
     def test_find_audio_files_single_file(self):
         """Test: Encontrar archivo individual"""
@@ -83,6 +118,44 @@ class TestBatchProcessor(unittest.TestCase):
         # Debe encontrar 3 archivos (test1, test2, test3)
         self.assertEqual(len(files), 3)
 
+    def test_find_audio_files_tree(self):
+        """Test: Árbol con extensiones mezcladas, mayúsculas y subdirectorios"""
+        root = Path(tempfile.mkdtemp(prefix="batch_tree_"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+
+        subdir = root / "sub"
+        deeper = subdir / "deeper"
+        deeper.mkdir(parents=True)
+        expected_top = [root / "a.wav", root / "SONG.WAV"]
+        expected_all = expected_top + [subdir / "b.Mp3", deeper / "c.flac"]
+        for audio_file in expected_all:
+            audio_file.touch()
+        (root / "notes.txt").touch()
+        (root / "fake.wav").mkdir()  # Directorio con nombre de audio: se ignora
+
+        files = self.processor.find_audio_files(str(root), recursive=True)
+        self.assertEqual(files, sorted(expected_all))
+
+        files = self.processor.find_audio_files(str(root), recursive=False)
+        self.assertEqual(files, sorted(expected_top))
+
+    def test_find_audio_files_symlinked_dirs(self):
+        """Test: Se siguen los enlaces a directorios, sin entrar en ciclos"""
+        root = Path(tempfile.mkdtemp(prefix="batch_tree_"))
+        outside = Path(tempfile.mkdtemp(prefix="batch_linked_"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, outside, ignore_errors=True)
+
+        (outside / "linked.wav").touch()
+        try:
+            (root / "linked").symlink_to(outside, target_is_directory=True)
+            (outside / "loop").symlink_to(root, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks no disponibles")
+
+        files = self.processor.find_audio_files(str(root), recursive=True)
+        self.assertEqual(files, [root / "linked" / "linked.wav"])
+
     def test_batch_result_success_rate(self):
         """Test: Cálculo de success rate"""
         result = BatchResult(
@@ -116,26 +189,17 @@ class TestBatchConversion(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Setup para tests de conversion"""
-        cls.test_dir = Path("/tmp/batch_conv_test")
-        cls.test_dir.mkdir(exist_ok=True)
+        cls.test_dir = Path(tempfile.mkdtemp(prefix="batch_conv_test_"))
 
-        # Crear archivos de prueba
-        sample_rate = 44100
-        duration = 1.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        audio = 0.5 * np.sin(2 * np.pi * 440 * t)
-        stereo = np.column_stack((audio, audio))
-
-        cls.file1 = cls.test_dir / "test1.wav"
-        sf.write(str(cls.file1), stereo, sample_rate)
+        # Crear archivos de prueba (stereo, 1 s, 440 Hz en ambos canales)
+        cls.file1 = _link_fixture(get_sine_wav(1.0, 2, 440.0, 440.0), cls.test_dir / "test1.wav")
 
         cls.processor = UniversalBatchProcessor()
 
     @classmethod
     def tearDownClass(cls):
         """Cleanup"""
-        if cls.test_dir.exists():
-            shutil.rmtree(cls.test_dir)
+        _discard_dir(cls.test_dir)
 
     def test_batch_convert_single_file(self):
         """Test: Convertir archivo individual"""
@@ -173,27 +237,18 @@ class TestBatchChannelConversion(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Setup para tests de channel conversion"""
-        cls.test_dir = Path("/tmp/batch_channel_test")
-        cls.test_dir.mkdir(exist_ok=True)
-
-        # Crear archivo stereo de prueba
-        sample_rate = 44100
-        duration = 1.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        left = 0.5 * np.sin(2 * np.pi * 440 * t)
-        right = 0.5 * np.sin(2 * np.pi * 554 * t)
-        stereo = np.column_stack((left, right))
+        cls.test_dir = Path(tempfile.mkdtemp(prefix="batch_channel_test_"))
 
-        cls.file1 = cls.test_dir / "stereo_test.wav"
-        sf.write(str(cls.file1), stereo, sample_rate)
+        # Crear archivo stereo de prueba (1 s, 440/554 Hz)
+        cls.file1 = _link_fixture(get_sine_wav(1.0, 2, 440.0, 554.0),
+                                  cls.test_dir / "stereo_test.wav")
 
         cls.processor = UniversalBatchProcessor()
 
     @classmethod
     def tearDownClass(cls):
         """Cleanup"""
-        if cls.test_dir.exists():
-            shutil.rmtree(cls.test_dir)
+        _discard_dir(cls.test_dir)
 
     def test_batch_channel_convert_to_mono(self):
         """Test: Convertir a mono en batch"""
@@ -212,19 +267,8 @@ class TestBatchChannelConversion(unittest.TestCase):
 
 def run_tests():
     """Ejecutar todos los tests"""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Agregar tests
-    suite.addTests(loader.loadTestsFromTestCase(TestBatchProcessor))
-    suite.addTests(loader.loadTestsFromTestCase(TestBatchConversion))
-    suite.addTests(loader.loadTestsFromTestCase(TestBatchChannelConversion))
-
-    # Ejecutar tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    return result.wasSuccessful()
+    test_cases = [TestBatchProcessor, TestBatchConversion, TestBatchChannelConversion]
+    return run_test_cases(test_cases)
 
 
 if __name__ == "__main__":
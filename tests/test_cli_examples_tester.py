@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests para scripts/test_cli_examples.py
+Testing de las sondas --help sobre main.py
+"""
+
+import unittest
+import sys
+import re
+import shutil
+import tempfile
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# scripts/ no es un paquete: cargar el tester directamente desde su archivo
+_spec = importlib.util.spec_from_file_location(
+    "cli_examples_tester", PROJECT_ROOT / "scripts" / "test_cli_examples.py"
+)
+cli_examples = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cli_examples)
+
+
+class TestHelpProbe(unittest.TestCase):
+    """Tests para las sondas '<python> main.py <subcomando> --help'"""
+
+    EXAMPLE = {'command': 'python main.py split --help'}
+
+    @classmethod
+    def setUpClass(cls):
+        """Directorio para los main.py de prueba y una copia de cli_data.yaml"""
+        cls.test_dir = Path(tempfile.mkdtemp(prefix="cli_probe_"))
+        # El tester deja un sidecar JSON junto al YAML: usar una copia para
+        # no escribir en docs/
+        cls.cli_data_file = cls.test_dir / "cli_data.yaml"
+        shutil.copyfile(PROJECT_ROOT / "docs" / "cli_data.yaml", cls.cli_data_file)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Limpiar archivos de prueba"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+
+    def _probe(self, main_source):
+        """Sondear 'split --help' contra un main.py con el código dado"""
+        main_py = self.test_dir / "main.py"
+        main_py.write_text(main_source, encoding='utf-8')
+        python_main = f"{sys.executable} {main_py}"
+
+        # Las sustituciones de comandos se memoizan con el PYTHON_MAIN real
+        self.addCleanup(cli_examples._prepare_command_cached.cache_clear)
+        self.addCleanup(cli_examples._placeholder_table.cache_clear)
+        cli_examples._prepare_command_cached.cache_clear()
+        cli_examples._placeholder_table.cache_clear()
+
+        help_probe_re = re.compile(r'^' + re.escape(python_main) + r'\s+(\S+)\s+--help$')
+        with mock.patch.object(cli_examples, 'PYTHON_MAIN', python_main), \
+                mock.patch.object(cli_examples, 'HELP_PROBE_RE', help_probe_re):
+            tester = cli_examples.CLIExamplesTester(str(self.cli_data_file))
+            tester.temp_dir = self.test_dir
+            return tester._test_single_example('split', 'help', self.EXAMPLE)
+
+    def test_broken_main_fails_probe(self):
+        """Test: Un main.py que no compila hace fallar la sonda"""
+        result = self._probe("def broken(:\n")
+
+        self.assertEqual(result.status, 'failed')
+        self.assertIn('SyntaxError', result.stderr)
+
+    def test_working_main_passes_probe(self):
+        """Test: La sonda ejecuta realmente main.py"""
+        result = self._probe("import sys\nsys.exit(0)\n")
+
+        self.assertEqual(result.status, 'passed')
+        self.assertEqual(result.note, '')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -6,6 +6,8 @@ Verifica la integración completa de las nuevas funcionalidades en el menú prin
 
 import unittest
 import sys
+import json
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -18,6 +20,21 @@ from audio_splitter.ui.interactive_i18n import (
 )
 
 
+@lru_cache(maxsize=None)
+def _translations(lang="es"):
+    """Cargar (una sola vez) el archivo de traducciones de un idioma"""
+    path = Path(__file__).parent.parent / "audio_splitter" / "i18n" / "languages" / f"{lang}.json"
+    return json.loads(path.read_bytes())
+
+
+def _printed_error(mock_print):
+    """True si alguna llamada a console.print mostró un mensaje de error"""
+    # Se inspecciona la llamada completa (todos los args y kwargs), no solo
+    # el primer argumento
+    return any('Error' in text or 'error' in text
+               for text in map(str, mock_print.call_args_list))
+
+
 class TestWorkflowsBatchIntegration(unittest.TestCase):
     """Tests de integración para workflows y batch processing"""
 
@@ -83,9 +100,7 @@ class TestWorkflowsBatchIntegration(unittest.TestCase):
             self.fail(f"Wrapper should handle exceptions: {e}")
 
         # Verificar que se mostró mensaje de error
-        error_calls = [call for call in mock_console.print.call_args_list
-                      if 'Error' in str(call) or 'error' in str(call)]
-        self.assertTrue(len(error_calls) > 0, "Should print error message")
+        self.assertTrue(_printed_error(mock_console.print), "Should print error message")
 
     @patch('audio_splitter.ui.interactive_i18n.run_batch_processing')
     @patch('audio_splitter.ui.interactive_i18n.console')
@@ -101,20 +116,12 @@ class TestWorkflowsBatchIntegration(unittest.TestCase):
             self.fail(f"Wrapper should handle exceptions: {e}")
 
         # Verificar que se mostró mensaje de error
-        error_calls = [call for call in mock_console.print.call_args_list
-                      if 'Error' in str(call) or 'error' in str(call)]
-        self.assertTrue(len(error_calls) > 0, "Should print error message")
+        self.assertTrue(_printed_error(mock_console.print), "Should print error message")
 
     def test_i18n_translations_workflows(self):
         """Test 7: Verificar que las traducciones de workflows están en el archivo JSON"""
-        import json
-        from pathlib import Path
-
         # Leer directamente el archivo de traducciones
-        es_json_path = Path(__file__).parent.parent / "audio_splitter" / "i18n" / "languages" / "es.json"
-
-        with open(es_json_path, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
+        translations = _translations("es")
 
         # Verificar que existe la sección workflows
         self.assertIn('workflows', translations, "workflows section should exist")
@@ -122,14 +129,8 @@ class TestWorkflowsBatchIntegration(unittest.TestCase):
 
     def test_i18n_translations_batch(self):
         """Test 8: Verificar que las traducciones de batch están en el archivo JSON"""
-        import json
-        from pathlib import Path
-
         # Leer directamente el archivo de traducciones
-        es_json_path = Path(__file__).parent.parent / "audio_splitter" / "i18n" / "languages" / "es.json"
-
-        with open(es_json_path, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
+        translations = _translations("es")
 
         # Verificar que existe la sección batch
         self.assertIn('batch', translations, "batch section should exist")
@@ -20,6 +20,7 @@ from audio_splitter.core.workflow_engine import (
     WorkflowError,
     create_workflow
 )
+from tests._runner import run_test_cases
 
 
 class MockSuccessStep(WorkflowStep):
@@ -65,6 +66,17 @@ class MockOptionalStep(WorkflowStep):
 class TestWorkflowEngine(unittest.TestCase):
     """Tests para WorkflowEngine"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Ejecutar una sola vez el workflow exitoso de 3 steps"""
+        # Los tests de ejecución exitosa solo inspeccionan el resultado, así
+        # que comparten esta ejecución en lugar de repetirla
+        cls.workflow = WorkflowEngine("Success Workflow")
+        cls.steps = [MockSuccessStep(f"Step {i}") for i in (1, 2, 3)]
+        for step in cls.steps:
+            cls.workflow.add_step(step)
+        cls.results = cls.workflow.execute(show_progress=False)
+
     def test_workflow_creation(self):
         """Test: Crear workflow básico"""
         workflow = create_workflow("Test Workflow", "Testing workflow creation")
@@ -100,17 +112,13 @@ class TestWorkflowEngine(unittest.TestCase):
 
     def test_successful_workflow_execution(self):
         """Test: Ejecutar workflow exitoso"""
-        workflow = WorkflowEngine("Success Workflow")
-        workflow.add_step(MockSuccessStep("Step 1"))
-        workflow.add_step(MockSuccessStep("Step 2"))
-        workflow.add_step(MockSuccessStep("Step 3"))
-
-        results = workflow.execute(show_progress=False)
+        results = self.results
 
         self.assertTrue(results['success'])
         self.assertEqual(results['completed_steps'], 3)
         self.assertEqual(results['total_steps'], 3)
         self.assertIsNone(results['failed_step'])
+        self.assertTrue(all(step.executed for step in self.steps))
 
     def test_failed_workflow_execution(self):
         """Test: Workflow que falla en un step"""
@@ -140,57 +148,42 @@ class TestWorkflowEngine(unittest.TestCase):
 
     def test_context_sharing_between_steps(self):
         """Test: Compartir datos entre steps via contexto"""
-        workflow = WorkflowEngine("Context Sharing Workflow")
-        step1 = MockSuccessStep("Step 1")
-        step2 = MockSuccessStep("Step 2")
-        workflow.add_step(step1).add_step(step2)
-
-        results = workflow.execute(show_progress=False)
-
-        # Verificar que ambos steps escribieron al contexto
-        self.assertTrue(workflow.context.get_metadata("Step 1_executed"))
-        self.assertTrue(workflow.context.get_metadata("Step 2_executed"))
+        # Verificar que todos los steps escribieron al contexto
+        for step in self.steps:
+            self.assertTrue(self.workflow.context.get_metadata(f"{step.name}_executed"))
 
     def test_step_status_tracking(self):
         """Test: Tracking de estados de steps"""
+        # Después de ejecución
+        for step in self.steps:
+            self.assertEqual(step.status, StepStatus.COMPLETED)
+
+        # Un step que el engine nunca alcanza sigue pendiente
         workflow = WorkflowEngine("Status Tracking Workflow")
         step1 = MockSuccessStep("Step 1")
-        step2 = MockSuccessStep("Step 2")
-        workflow.add_step(step1).add_step(step2)
-
-        # Antes de ejecución
-        self.assertEqual(step1.status, StepStatus.PENDING)
-        self.assertEqual(step2.status, StepStatus.PENDING)
+        failing_step = MockFailStep("Failing Step")
+        step3 = MockSuccessStep("Step 3")
+        workflow.add_step(step1).add_step(failing_step).add_step(step3)
 
-        # Después de ejecución
         workflow.execute(show_progress=False)
 
         self.assertEqual(step1.status, StepStatus.COMPLETED)
-        self.assertEqual(step2.status, StepStatus.COMPLETED)
+        self.assertEqual(failing_step.status, StepStatus.FAILED)
+        self.assertEqual(step3.status, StepStatus.PENDING)
 
     def test_workflow_duration_tracking(self):
         """Test: Tracking de duración del workflow"""
-        workflow = WorkflowEngine("Duration Tracking Workflow")
-        workflow.add_step(MockSuccessStep("Step 1"))
-
-        results = workflow.execute(show_progress=False)
-
-        self.assertIn('duration', results)
-        self.assertIsInstance(results['duration'], float)
-        self.assertGreater(results['duration'], 0)
+        self.assertIn('duration', self.results)
+        self.assertIsInstance(self.results['duration'], float)
+        self.assertGreater(self.results['duration'], 0)
 
     def test_step_duration_tracking(self):
         """Test: Tracking de duración de steps individuales"""
-        workflow = WorkflowEngine("Step Duration Workflow")
-        step = MockSuccessStep("Timed Step")
-        workflow.add_step(step)
-
-        workflow.execute(show_progress=False)
-
-        duration = step.get_duration()
-        self.assertIsNotNone(duration)
-        self.assertIsInstance(duration, float)
-        self.assertGreater(duration, 0)
+        for step in self.steps:
+            duration = step.get_duration()
+            self.assertIsNotNone(duration)
+            self.assertIsInstance(duration, float)
+            self.assertGreater(duration, 0)
 
 
 class TestWorkflowContext(unittest.TestCase):
@@ -268,20 +261,8 @@ class TestWorkflowStep(unittest.TestCase):
 
 def run_tests():
     """Ejecutar todos los tests"""
-    # Crear test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Agregar tests
-    suite.addTests(loader.loadTestsFromTestCase(TestWorkflowEngine))
-    suite.addTests(loader.loadTestsFromTestCase(TestWorkflowContext))
-    suite.addTests(loader.loadTestsFromTestCase(TestWorkflowStep))
-
-    # Ejecutar tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    return result.wasSuccessful()
+    test_cases = [TestWorkflowEngine, TestWorkflowContext, TestWorkflowStep]
+    return run_test_cases(test_cases)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,24 @@
 #!/usr/bin/env python3
 """Verification script for minimal distribution"""
 
+import os
 import sys
-from pathlib import Path
+
+def find_missing(required_files):
+    """Return the required paths that do not exist, listing each directory once"""
+    listings = {}
+    missing = []
+    for f in required_files:
+        directory, _, name = f.rpartition("/")
+        directory = directory or "."
+        if directory not in listings:
+            try:
+                listings[directory] = set(os.listdir(directory))
+            except OSError:
+                listings[directory] = set()
+        if name not in listings[directory]:
+            missing.append(f)
+    return missing
 
 def verify():
     """Verify minimal distribution"""
@@ -17,7 +33,7 @@ def verify():
         "audio_splitter/ui/cli.py"
     ]
     
-    missing = [f for f in required_files if not Path(f).exists()]
+    missing = find_missing(required_files)
     
     if missing:
         print(f"❌ Missing files: {missing}")